@@ -0,0 +1,43 @@
+"""benchmark of bulk disinheritance with in_types, against an in_type loop
+(user-008)
+
+- 1,000 sibling str subclasses are created for each repetition, and the
+  best of five repetitions is reported
+
+run from the repository root:
+    PYTHONPATH=src python benchmarks/bulk.py
+"""
+
+
+import time
+
+from disinheritance import disinherit
+
+
+def make_targets(count: int = 1000) -> list[type]:
+    return list(type(f'S{i}', (str,), {}) for i in range(count))
+
+
+def in_type_loop(targets: list[type]):
+    for i in targets: disinherit.in_type(i)
+    return
+
+
+def measure(function: callable, repeat: int = 5) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        targets = make_targets()
+        start = time.perf_counter()
+        function(targets)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def main():
+    print('ms for 1,000 sibling str subclasses')
+    print(f'    in_type loop: {measure(in_type_loop):6.1f}')
+    print(f'    in_types:     {measure(disinherit.in_types):6.1f}')
+    return
+
+
+if __name__ == '__main__': main()
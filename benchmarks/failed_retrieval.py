@@ -0,0 +1,54 @@
+"""benchmark of failed retrieval of disinherited methods with hasattr()
+and getattr() with a default (user-017)
+
+- getter mode: str subclass with a wrapped __getattribute__
+- descriptor mode: str subclass with descriptors raising AttributeError
+- with __getattr__: str subclass (getter mode) owning a __getattr__,
+  with calls of the __getattr__ for disinherited methods counted
+- the best of five runs is reported
+
+run from the repository root:
+    PYTHONPATH=src python benchmarks/failed_retrieval.py
+"""
+
+
+import timeit
+
+from disinheritance import disinherit
+
+
+STATEMENTS = "hasattr(instance, 'upper')", "getattr(instance, 'upper', None)"
+fallbacks = 0
+
+
+@disinherit()
+class GetterMode(str): pass
+
+
+@disinherit(descriptor=True)
+class DescriptorMode(str): pass
+
+
+@disinherit()
+class WithGetattr(str):
+
+    def __getattr__(self, name):
+        global fallbacks
+        fallbacks += 1
+        raise AttributeError(name)
+
+
+def main():
+    print('ns per failed retrieval')
+    for target in GetterMode, DescriptorMode, WithGetattr:
+        instance = target('abc')
+        for statement in STATEMENTS:
+            best = min(timeit.repeat(statement, globals={'instance': instance},
+                                     number=200000, repeat=5))
+            print(f'    {target.__name__:14s} {statement:32s} '
+                  f'{best / 200000 * 1e9:6.0f}')
+    print(f'__getattr__ calls: {fallbacks}')
+    return
+
+
+if __name__ == '__main__': main()
@@ -0,0 +1,42 @@
+"""benchmark of per-access latency through the wrapped __getattribute__
+of a str subclass (user-012)
+
+- instance attribute: retrieval of a name assigned in the instance
+- own method: retrieval of a method owned by the target type
+- blocked hasattr: hasattr() on a disinherited method
+- the best of seven runs is reported
+
+run from the repository root:
+    PYTHONPATH=src python benchmarks/getter.py
+"""
+
+
+import timeit
+
+from disinheritance import disinherit
+
+
+STATEMENTS = (('instance attribute', 'instance.value'),
+              ('own method', 'instance.own'),
+              ('blocked hasattr', "hasattr(instance, 'upper')"))
+
+
+@disinherit()
+class Standin(str):
+
+    def own(self):
+        return
+
+
+def main():
+    instance = Standin('abc')
+    instance.value = 1
+    print('ns per access')
+    for label, statement in STATEMENTS:
+        best = min(timeit.repeat(statement, globals={'instance': instance},
+                                 number=300000, repeat=7))
+        print(f'    {label:18s} {best / 300000 * 1e9:6.0f}')
+    return
+
+
+if __name__ == '__main__': main()
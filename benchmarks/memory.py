@@ -0,0 +1,60 @@
+"""benchmark of memory per instance of str subclasses with and without
+slots (user-024)
+
+- 100,000 instances of each type are created while tracing allocations
+  (tracemalloc), and traced bytes are reported per instance
+- "__dict__ materialised" instances have their __dict__ retrieved once
+  (as by code assigning instance attributes)
+
+run from the repository root:
+    PYTHONPATH=src python benchmarks/memory.py
+"""
+
+
+import gc
+import tracemalloc
+
+from disinheritance import disinherit
+
+
+@disinherit(exempt=str.upper, slots=True)
+class Slotted(str): pass
+
+
+@disinherit(exempt=str.upper)
+class Unslotted(str): pass
+
+
+class Undecorated(str):
+
+    __slots__ = ()
+
+
+def materialised(value: str) -> Unslotted:
+    instance = Unslotted(value)
+    instance.__dict__
+    return instance
+
+
+def measure(factory: callable, count: int = 100000) -> float:
+    gc.collect()
+    tracemalloc.start()
+    instances = list(factory(f'token{i:06d}') for i in range(count))
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size / len(instances)
+
+
+def main():
+    print('bytes per instance')
+    for label, factory in (('plain str', str),
+                           ('undecorated, __slots__ = ()', Undecorated),
+                           ('disinherited, slots=True', Slotted),
+                           ('disinherited, no slots', Unslotted),
+                           ('disinherited, no slots, __dict__ '
+                            'materialised', materialised)):
+        print(f'    {label:48s} {measure(factory):6.0f}')
+    return
+
+
+if __name__ == '__main__': main()
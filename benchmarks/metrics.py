@@ -0,0 +1,40 @@
+"""benchmark of counting failed retrievals (user-021)
+
+- 200,000 hasattr() calls on a disinherited method of a str subclass
+  with metrics disabled, enabled, and enabled with call sites sampled
+  (1 in 100), against retrieval of an exempt method
+- the best of five runs is reported
+
+run from the repository root:
+    PYTHONPATH=src python benchmarks/metrics.py
+"""
+
+
+import timeit
+
+from disinheritance import disinherit
+
+
+@disinherit(exempt=str.upper)
+class Standin(str): pass
+
+
+def measure(statement: str) -> float:
+    return min(timeit.repeat(statement, globals={'instance': Standin('a')},
+                             number=200000, repeat=5))
+
+
+def main():
+    print('s per 200,000 calls (failed retrieval / exempt retrieval)')
+    for label, sample in (('disabled', None), ('enabled', 0),
+                          ('sampled', 100)):
+        if sample is None: disinherit.disable_metrics()
+        else: disinherit.enable_metrics(sample)
+        failed = measure("hasattr(instance, 'lower')")
+        allowed = measure('instance.upper')
+        print(f'    {label:8s} {failed:6.3f} / {allowed:6.3f}')
+    disinherit.disable_metrics()
+    return
+
+
+if __name__ == '__main__': main()
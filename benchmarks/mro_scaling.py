@@ -0,0 +1,77 @@
+"""benchmark of disinheritance cost by MRO depth and width (user-001)
+
+- depth: target types derived from a chain of types, each owning five
+  methods
+- width: target types derived directly from many bases, each owning five
+  methods
+- a new base MRO is built for each repetition, so plans and cached names
+  are not reused (i.e., the first disinheritance of each base MRO is
+  measured), and the best of the repetitions is reported
+- garbage collection is disabled while measuring (as with timeit), as
+  collections of previous chains otherwise dominate at large depths
+- cost per type in the MRO must not grow by more than a factor of
+  LINEAR between the smallest and largest depth (i.e., scaling must be
+  linear), otherwise an AssertionError is raised
+
+run from the repository root (e.g., on this commit and its parent):
+    PYTHONPATH=src python benchmarks/mro_scaling.py
+"""
+
+
+import gc
+import time
+
+from disinheritance import disinherit
+
+
+DEPTHS = 100, 200, 400, 800
+LINEAR = 2.0
+
+
+def make_namespace(prefix: str, width: int = 5) -> dict:
+    return dict((f'{prefix}_{i}', lambda self: None) for i in range(width))
+
+
+def make_chain(depth: int) -> tuple[type]:
+    base = object
+    for i in range(depth): base = type(f'L{i}', (base,), make_namespace(i))
+    return base,
+
+
+def make_bases(width: int) -> tuple[type]:
+    return tuple(type(f'W{i}', (), make_namespace(i)) for i in range(width))
+
+
+def measure(make_bases: callable, size: int, repeat: int = 20) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        target = type('T', make_bases(size), {})
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            disinherit.in_type(target)
+            best = min(best, time.perf_counter() - start)
+        finally: gc.enable()
+    return best * 1e3
+
+
+def main():
+    print('ms per in_type call (us per type in the MRO)')
+    costs = list()
+    for size in DEPTHS:
+        cost = measure(make_chain, size)
+        costs.append(cost / size)
+        print(f'    depth {size:4d}: {cost:8.2f} ({cost / size * 1e3:5.2f})')
+    for size in (10, 50, 100):
+        cost = measure(make_bases, size)
+        print(f'    width {size:4d}: {cost:8.2f} ({cost / size * 1e3:5.2f})')
+    if costs[-1] > LINEAR * costs[0]:
+        error = AssertionError(
+            f'cost per type grew {costs[-1] / costs[0]:.1f}x from depth '
+            f'{DEPTHS[0]} to {DEPTHS[-1]} (not linear)')
+        raise error
+    return
+
+
+if __name__ == '__main__': main()
@@ -0,0 +1,87 @@
+"""benchmark of decoration cost on cold imports from a zipapp (i.e.,
+through zipimport), with types keyed by identity against the baseline
+keys derived from inspect.getabsfile for every type in every MRO (user-003)
+
+- a generated module defining chains of base types and disinherited
+  subclasses is imported from a zipapp in fresh processes
+- the baseline emulates the former _make_type_key (getabsfile, falling
+  back to the module name) for each type in the MRO on every decoration
+- the best import time of seven processes is reported
+
+run from the repository root:
+    PYTHONPATH=src python benchmarks/type_keys.py
+"""
+
+
+import os
+import subprocess
+import sys
+import tempfile
+import zipapp
+
+
+CHAINS = 10
+TYPES = 300
+MAIN = '''import os
+import sys
+from inspect import getabsfile
+from inspect import getmodule
+from time import perf_counter
+
+from disinheritance import disinherit
+
+if os.environ.get('BENCHMARK_BASELINE'):
+    map_cached = disinherit._map_cached.__func__
+    def _map_cached(cls, mro):
+        for i in mro:
+            try: f'{getabsfile(i)}->{repr(i.__name__)}'
+            except: f'{getmodule(i).__name__}->{repr(i.__name__)}'
+        return map_cached(cls, mro)
+    disinherit._map_cached = classmethod(_map_cached)
+start = perf_counter()
+import plugins
+print(perf_counter() - start)
+'''
+
+
+def make_plugins() -> str:
+    lines = ['from disinheritance import disinherit', '', 'class B0(dict):',
+             '    def own(self): return']
+    for i in range(1, CHAINS):
+        lines += [f'class B{i}(B{i - 1}):', f'    def own{i}(self): return']
+    for i in range(TYPES):
+        lines += ['@disinherit()', f'class P{i}(B{i % CHAINS}): pass']
+    return '\n'.join(lines) + '\n'
+
+
+def measure(archive: str, baseline: bool) -> float:
+    env = dict(os.environ)
+    if baseline: env['BENCHMARK_BASELINE'] = '1'
+    runs = list()
+    for _ in range(7):
+        result = subprocess.run((sys.executable, archive), env=env,
+                                capture_output=True, text=True, check=True)
+        runs.append(float(result.stdout))
+    return min(runs)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, 'app')
+        os.mkdir(source)
+        for name, content in (('__main__.py', MAIN),
+                              ('plugins.py', make_plugins())):
+            with open(os.path.join(source, name), 'w') as file:
+                file.write(content)
+        archive = os.path.join(directory, 'app.pyz')
+        zipapp.create_archive(source, archive)
+        print(f'import of {TYPES} disinherited types from a zipapp')
+        for label, baseline in (('identity keys', False),
+                                ('getabsfile keys', True)):
+            best = measure(archive, baseline)
+            print(f'    {label:16s} {best * 1e3:7.2f} ms '
+                  f'{best / TYPES * 1e6:7.1f} us per type')
+    return
+
+
+if __name__ == '__main__': main()
@@ -0,0 +1,42 @@
+"""benchmark of attribute retrieval and dir() through decorated
+hierarchies of 1, 3 and 10 levels (user-010)
+
+- each level is a dict subclass disinherited from the previous level,
+  owning one method and an attribute retrieved from instances of the
+  last level
+- the best of five runs is reported
+
+run from the repository root:
+    PYTHONPATH=src python benchmarks/wrapper_depth.py
+"""
+
+
+import timeit
+
+from disinheritance import disinherit
+
+
+def make_instance(levels: int) -> dict:
+    base = dict
+    for i in range(levels):
+        namespace = {f'method_{i}': lambda self: None, 'value': i}
+        base = disinherit.in_type(type(f'L{i}', (base,), namespace))
+    return base()
+
+
+def measure(statement: str, instance: dict, number: int) -> float:
+    return min(timeit.repeat(statement, globals={'instance': instance},
+                             number=number, repeat=5)) / number
+
+
+def main():
+    print('attribute retrieval (ns) / dir() (us)')
+    for levels in (1, 3, 10):
+        instance = make_instance(levels)
+        retrieval = measure('instance.value', instance, 200000) * 1e9
+        listing = measure('dir(instance)', instance, 2000) * 1e6
+        print(f'    {levels:2d} levels: {retrieval:6.0f} / {listing:5.1f}')
+    return
+
+
+if __name__ == '__main__': main()
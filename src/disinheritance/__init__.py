@@ -2,3 +2,5 @@
 
 
 from ._disinherit import *
+from ._freeze import *
+from ._plan_cache import *
@@ -0,0 +1,109 @@
+"""command line interface for the disinheritance library
+
+- cache clear: removes all entries from the on-disk plan cache
+- cache prune: removes stale entries from the on-disk plan cache
+- freeze: generates a frozen module (or verifies a frozen module against
+  the live module)
+- profile: imports modules with profiling enabled and summarizes time
+  spent disinheriting each type, sorted by cost
+"""
+
+
+import argparse
+import importlib
+import sys
+
+from ._disinherit import disinherit
+from ._freeze import freeze_module
+from ._freeze import verify_frozen
+from ._plan_cache import PlanCache
+
+
+def main(args: list[str] = None) -> int:
+    """runs the command line interface with arguments (or sys.argv),
+    returning an exit status
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m disinheritance',
+        description='manage disinheritance of subclassed object types')
+    commands = parser.add_subparsers(dest='command', required=True)
+    cache = commands.add_parser(
+        'cache', help='manage the on-disk cache of compiled plans')
+    actions = cache.add_subparsers(dest='action', required=True)
+    clear = actions.add_parser('clear', help='remove all entries')
+    prune = actions.add_parser(
+        'prune', help='remove entries from other Python versions, invalid '
+        'entries, and abandoned temporary files')
+    prune.add_argument('--max-age', type=float, metavar='DAYS',
+                       help='also remove entries older than DAYS')
+    for i in clear, prune:
+        i.add_argument('--path', default=None,
+                       help='cache directory (default: '
+                       f'{PlanCache.default_path()})')
+    freeze = commands.add_parser(
+        'freeze', help='generate a module with explicit disinheritance '
+        'overrides for types disinherited in a module')
+    freeze.add_argument('module', help='name of the module to freeze')
+    freeze.add_argument('-o', '--output', metavar='PATH',
+                        help='write the frozen module to PATH (default: '
+                        'standard output)')
+    freeze.add_argument('--verify', metavar='PATH',
+                        help='compare the frozen module at PATH with the '
+                        'live module instead of generating it')
+    profile = commands.add_parser(
+        'profile', help='summarize time spent disinheriting types defined '
+        'in modules, sorted by cost')
+    profile.add_argument('modules', nargs='+', metavar='module',
+                         help='name of a module to import and profile')
+    profile.add_argument('--top', type=int, metavar='N',
+                         help='show only the N most costly types')
+    args = parser.parse_args(args)
+    if args.command == 'cache':
+        plan_cache = PlanCache(args.path)
+        if args.action == 'clear': removed = plan_cache.clear()
+        else:
+            max_age = None if args.max_age is None else args.max_age * 86400
+            removed = plan_cache.prune(max_age)
+        print(f'removed {removed} file(s) from {plan_cache.path}')
+    elif args.command == 'profile':
+        disinherit.enable_profiling()
+        for name in args.modules:
+            module = importlib.import_module(name)
+            disinherit._resolve_pending(tuple(
+                i for i in list(disinherit._pending)
+                if i.__module__ == module.__name__))
+        records = disinherit.get_profile()
+        disinherit.disable_profiling()
+        print(_format_profile(records, args.top))
+    elif args.verify:
+        differences = verify_frozen(args.module, args.verify)
+        for i in differences: print(i, file=sys.stderr)
+        if differences: return 1
+        print(f'{args.verify} matches {args.module}')
+    else:
+        source = freeze_module(args.module)
+        if args.output is None: sys.stdout.write(source)
+        else:
+            with open(args.output, 'w') as file: file.write(source)
+    return 0
+
+
+def _format_profile(records: list[dict], top: int = None) -> str:
+    """internal function to format profiling records (see
+    disinherit.enable_profiling) as a table sorted by total time, with
+    times in milliseconds
+    """
+    phases = 'total', 'mapping', 'coercion', 'invalid', 'wrapping'
+    counts = 'mro', 'blocked', 'exempt'
+    lines = [' '.join(f'{i:>9}' for i in phases + counts) + '  type']
+    ordered = sorted(records, key=lambda i: i['total'], reverse=True)
+    for record in ordered[:top]:
+        lines.append(' '.join(
+            [f'{record[i] * 1000:9.3f}' for i in phases] +
+            [f'{record[i]:9d}' for i in counts]) + f'  {record["type"]}')
+    total = sum(i['total'] for i in records) * 1000
+    lines.append(f'{len(records)} type(s) disinherited in {total:.3f} ms')
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__': raise SystemExit(main())
@@ -3,13 +3,48 @@ types
 """
 
 
+import os
+import sys
+from collections.abc import Callable
+from functools import partial
 from functools import wraps
-from inspect import getabsfile
-from inspect import getmodule
+from hashlib import sha256
+from threading import RLock
+from threading import local
+from time import monotonic
+from time import perf_counter
+from types import FunctionType
 from types import MethodType
+from types import ModuleType
+from warnings import warn
+from warnings import warn_explicit
+from weakref import WeakKeyDictionary
+from weakref import WeakSet
+from weakref import WeakValueDictionary
+from weakref import finalize
+from weakref import ref
 
+from ._plan_cache import PlanCache
 
-__all__ = 'disinherit',
+
+__all__ = 'disinherit', 'DisinheritancePlan', 'DisinheritedAccessWarning', \
+          'DisinheritedAttributeError', 'DisinheritedType'
+
+
+_FORMAT = b'3'  # revision of compiled plans, for on-disk cache entries
+_IMMUTABLE = 1 << 8  # Py_TPFLAGS_IMMUTABLETYPE (e.g., set for type)
+_OPERATORS = frozenset(
+    f'__{j}{i}__' for i in ('add', 'and', 'divmod', 'floordiv', 'lshift',
+                            'matmul', 'mod', 'mul', 'or', 'pow', 'rshift',
+                            'sub', 'truediv', 'xor')
+    for j in ('', 'r', 'i') if f'{j}{i}' != 'idivmod') | frozenset(
+    f'__{i}__' for i in ('eq', 'ge', 'gt', 'le', 'lt', 'ne'))
+_PROTOCOLS = frozenset(
+    f'__{i}__' for i in ('abs', 'aenter', 'aexit', 'aiter', 'anext', 'await',
+                         'bool', 'call', 'complex', 'contains', 'delitem',
+                         'enter', 'exit', 'float', 'getitem', 'index', 'int',
+                         'invert', 'iter', 'len', 'length_hint', 'neg',
+                         'next', 'pos', 'reversed', 'setitem'))
 
 
 class disinherit:
@@ -21,6 +56,8 @@ class disinherit:
     - exemptions not available through inheritance or overridden in the
       target type are ignored
     - functionally required "origin" object methods will be retained
+      -> __getattr__ is also retained (as with __getattribute__), wrapped
+         to prevent fallback retrieval of disinherited methods/attributes
     - disinherited methods/attributes are replaced with NotImplemented in
       the target type
       -> NotImplemented methods/attributes are ignored in dir() calls for
@@ -29,43 +66,643 @@ class disinherit:
       -> provides explicit status in help() call on target type
       -> use ensures reversion back to disinheritance if used for
          assignment but deleted in instances
+    - names owned by each type are cached process-wide (weakly referenced
+      by type) and refreshed when a type namespace or its bases change,
+      and names available in a type are merged from them along its MRO
+      (i.e., in linear time), cached only for target types and exempt
+      types
+    - lazy keyword argument defers disinheritance of the target type until
+      first instantiation of the target type (or a subclass)
+    - disinheritance is compiled to a plan (see DisinheritancePlan) shared
+      by all target types with the same base MRO and exemptions
+    - plans are optionally cached on disk (see enable_plan_cache) for fast
+      cold starts, enabled at import by the DISINHERITANCE_CACHE_DIR
+      environment variable
+    - propagate keyword argument propagates disinheritance of the target
+      type to its subclasses as they are defined (see in_subclass)
+    - __dir__ and __getattribute__ are wrapped once per hierarchy, so
+      target types inheriting wrappers from disinherited bases reuse (or
+      replace) them (i.e., one check per call regardless of hierarchy
+      depth)
+    - wrapped __getattribute__ checks names against the blocked names of
+      the target type, so other names (including instance attributes
+      assigned NotImplemented) are retrieved after one membership check,
+      while blocked names still go through the full base lookup (as
+      instance attributes and overrides take precedence) before the
+      retrieved value is checked
+    - retrieval of disinherited methods/attributes fails with an
+      AttributeError (see DisinheritedAttributeError) formatting its
+      message lazily (i.e., only where shown), and __getattr__ in the
+      target type is not called for disinherited methods/attributes
+    - names available (and not disinherited) in a target type are cached
+      for wrapped __dir__ (see _get_visible), so dir() calls on instances
+      merge cached names with instance attribute names without retrieving
+      methods/attributes (i.e., properties and other descriptors are not
+      evaluated)
+    - descriptor keyword argument replaces disinherited methods/attributes
+      with descriptors raising an AttributeError from target type
+      instances (and returning NotImplemented from the target type)
+      instead of wrapping __getattribute__, so allowed methods/attributes
+      are retrieved without overhead
+    - type_level keyword argument (implying descriptor) also produces an
+      AttributeError when disinherited methods/attributes are retrieved
+      from the target type, and excludes them from dir() calls on the
+      target type where its metaclass is (or can be replaced with a
+      subclass of) DisinheritedType
+      -> the target type metaclass is only replaced where mutable (i.e.,
+         not type), otherwise DisinheritedType must be declared as the
+         metaclass of the target type for type-level dir() filtering, or
+         type_level='rebuild' given to rebuild the target type with
+         DisinheritedType as its metaclass (see _rebuild)
+      -> help() calls on the target type omit disinherited
+         methods/attributes
+    - disinherited binary operator, rich comparison and other protocol
+      methods called by the interpreter are replaced with static methods
+      (see _Unsupported), so operations fall back to reflected methods of
+      other operands (and otherwise fail with a TypeError) as with types
+      not supporting them
+    - slots keyword argument rebuilds a target type not declaring
+      __slots__ with __slots__ (empty, or the slots given), so instances
+      of target types with slotted bases (e.g., str, tuple or int) have
+      no __dict__ (see _rebuild)
+    - types rebuilt from target types by other decorators (e.g.,
+      dataclass with slots=True) after disinheritance reuse the plan
+      applied to the target type (see in_rebuilt), and slotted target
+      types rebuilt before disinheritance have methods referencing the
+      discarded type by closure rebound (see _rebind)
+    - enforcement (i.e., wrappers, descriptors and metaclasses) can be
+      turned off or reduced to reporting (i.e., audit) process-wide (see
+      set_enforcement), enabled at import by the
+      DISINHERITANCE_ENFORCEMENT environment variable (case-insensitive,
+      with a RuntimeWarning and strict enforcement where invalid)
+    - time spent disinheriting each target type (see in_type) can be
+      recorded by phase (opt-in; see enable_profiling)
+    - failed retrievals of disinherited methods/attributes can be counted
+      by type and name (opt-in; see enable_metrics), in per-thread tables
+      (i.e., without locks) updated only on failure, with optional
+      sampling of call sites
+      -> tables of ended threads are folded into one table (see
+         _fold_tables), so tables do not accumulate with threads
     """
 
+    _applied = WeakKeyDictionary()
+    _auditing = None, 10.0
+    _available = WeakKeyDictionary()
+    _cache = WeakKeyDictionary()
+    _digests = WeakKeyDictionary()
+    _enforcement = 'strict'
+    _folded = WeakKeyDictionary(), WeakKeyDictionary()
+    _local = local()
+    _lock = RLock()
+    _metrics = None
+    _modes = 'strict', 'audit', 'off'
+    _pending = WeakKeyDictionary()
+    _plan_cache = None
+    _plans = WeakValueDictionary()
+    _profiling = None
+    _propagating = WeakSet()
+    _reported = WeakKeyDictionary()
+    _required = None
+    _tables = list()
+    _types = WeakKeyDictionary()
+    _visible = WeakKeyDictionary()
+    _window = 0.0, 0
+    _wrappers = WeakKeyDictionary()
+
     def __init__(self, *, exempt: type | MethodType |
                  list[type | MethodType] | tuple[type | MethodType] |
-                 set[type | MethodType] = None):
+                 set[type | MethodType] = None, lazy: bool = False,
+                 propagate: bool = False, descriptor: bool = False,
+                 type_level: bool | str = False,
+                 slots: bool | str | list[str] | tuple[str] = False):
         self.exempt = exempt
+        self.lazy = lazy
+        self.propagate = propagate
+        self.descriptor = descriptor
+        self.type_level = type_level
+        self.slots = slots
         return
 
     def __call__(self, target: type):
-        return self.in_type(target, self.exempt)
+        slots = None if self.slots is False else \
+                () if self.slots is True else self.slots
+        metaclass = DisinheritedType if self.type_level == 'rebuild' and \
+                    type(target).__flags__ & _IMMUTABLE else None
+        if slots is not None or metaclass is not None:
+            target = self._rebuild(target, slots, metaclass)
+        elif '__slots__' in vars(target): self._rebind(target)
+        options = self.exempt, self.descriptor, bool(self.type_level)
+        if self.lazy: self.in_type_lazy(target, *options)
+        else: self.in_type(target, *options)
+        if self.propagate: self._propagate(target)
+        return target
 
     @classmethod
     def in_type(cls, target: type, exempt: type | MethodType |
                 list[type | MethodType] | tuple[type | MethodType] |
-                set[type | MethodType] = None) -> type:
+                set[type | MethodType] = None, descriptor: bool = False,
+                type_level: bool = False) -> type:
         """disinherits methods/attributes from a target type, except for
         required methods and specified exemptions
         """
-        mro_map = cls._map_mro(target)
-        exempt = cls._coerce_exempt(mro_map, exempt)
-        invalid = cls._get_invalid_names(target, mro_map, exempt)
-        for name in invalid: setattr(target, name, NotImplemented)
-        target_map = dict((k, v) for k, v in cls._map_type(target).items()
-                          if k not in invalid)
-        for exempt_map in exempt.values():
-            for name, value in exempt_map.items():
-                if name not in target_map:
-                    setattr(target, name, value)
-        cls._wrap_dir(target)
-        cls._wrap_getter(target)
+        cls._resolve_pending(target.__mro__)
+        if cls._profiling is not None:
+            return cls._profile(target, exempt, descriptor, type_level)
+        plan = cls.compile(target.__mro__[1:], exempt)
+        return plan.apply(target, descriptor, type_level)
+
+    @classmethod
+    def in_type_lazy(cls, target: type, exempt: type | MethodType |
+                     list[type | MethodType] | tuple[type | MethodType] |
+                     set[type | MethodType] = None,
+                     descriptor: bool = False,
+                     type_level: bool = False) -> type:
+        """defers disinheritance of methods/attributes from a target type
+        (as with in_type) until first instantiation of the target type or
+        a subclass, or first attribute retrieval from an instance, by
+        temporarily overriding __init__ and __getattribute__ in the target
+        type
+        
+        - __init__ is overridden rather than __new__, as an inherited
+          object.__new__ cannot be restored as a type slot once overridden
+        - __getattribute__ covers instances created without __init__
+          (e.g., by pickle, copy or __new__ calls), as retrieving
+          __setstate__ or __dict__ (or any other attribute) from them
+          resolves disinheritance, while operators and protocols (i.e.,
+          retrieved from the type) do not
+        - types rebuilt from the target type (see in_rebuilt) are detected
+          when instantiated or retrieved from
+        """
+        init_base = vars(target).get('__init__')
+        getter_base = vars(target).get('__getattribute__')
+        def resolve(obj: object):
+            if target not in type(obj).__mro__:
+                rebuilt = next((i for i in type(obj).__mro__
+                                if vars(i).get('__init__') is __init__), None)
+                if rebuilt is not None: cls.in_rebuilt(rebuilt, target)
+            cls._resolve_pending((target,))
+            return
+        @wraps(target.__init__)
+        def __init__(self, *args, **kwargs):
+            resolve(self)
+            return target.__init__(self, *args, **kwargs)
+        @wraps(target.__getattribute__)
+        def __getattribute__(self, name: str):
+            resolve(self)
+            return target.__getattribute__(self, name)
+        with cls._lock:
+            cls._pending[target] = (exempt, descriptor, type_level,
+                                    init_base, getter_base)
+            target.__init__ = __init__
+            target.__getattribute__ = __getattribute__
         return target
 
+    @classmethod
+    def in_type_frozen(cls, target: type, mro: tuple[str] = (),
+                       blocked: tuple[str] = (),
+                       exempt: tuple[tuple[str, int]] = (),
+                       propagate: bool = False, descriptor: bool = False,
+                       type_level: bool = False) -> type:
+        """applies frozen disinheritance (as generated by freeze_module) to
+        a target type without MRO introspection, where blocked names are
+        assigned NotImplemented in the target type body and exemptions are
+        pairs of names and indexes of types in the target type MRO
+        
+        - a RuntimeWarning is issued if type keys of the target base MRO
+          differ from those when frozen
+        - propagate keyword argument propagates disinheritance of the
+          target type to its subclasses (see in_subclass)
+        - descriptor and type_level keyword arguments replace blocked
+          names assigned NotImplemented with descriptors (as with in_type)
+        """
+        if mro and tuple(map(cls._make_type_key,
+                             target.__mro__[1:])) != tuple(mro):
+            warn(f'base MRO of {repr(target)} differs from frozen MRO '
+                 f'{mro}', RuntimeWarning, stacklevel=2)
+        plan = DisinheritancePlan(
+            target.__mro__[1:], frozenset(blocked),
+            tuple((name, cls._get_static(target.__mro__[i], name))
+                  for name, i in exempt), cls._get_required())
+        plan.apply(target, descriptor, type_level)
+        if propagate: cls._propagate(target)
+        return target
+
+    @classmethod
+    def in_rebuilt(cls, target: type, original: type = None) -> type:
+        """reapplies disinheritance of an original type to a target type
+        rebuilt from it (e.g., by dataclass with slots=True, or other
+        decorators returning a new type applied after disinherit), reusing
+        the plan applied to the original type instead of compiling one
+        
+        - the original type (if not given) is the type most recently
+          disinherited (or deferred) with the module, qualified name and
+          bases of the target type
+        - methods (including wrappers) referencing the original type by
+          closure are rebound to the target type (see _rebind)
+        - where overrides and wrappers of the original type were copied to
+          the target type (as with dataclass), the target type is only
+          recorded as disinherited, otherwise the plan is applied again
+        - deferred (see in_type_lazy) and propagated (see _propagate)
+          disinheritance of the original type is deferred and propagated
+          for the target type, and rebuilt types are detected
+          automatically when instantiated (if deferred) or subclassed (if
+          propagated), otherwise in_rebuilt can be applied as a decorator
+          (i.e., after the rebuilding decorator)
+        - decorators generating methods (e.g., dataclass) do not replace
+          disinherited methods/attributes (or a deferred __init__) in the
+          original type, so disinherit should be applied after (i.e.,
+          above) such decorators where possible
+        """
+        if original is None:
+            original = next((
+                i for i in reversed((*cls._applied, *cls._pending))
+                if i is not target and i.__module__ == target.__module__
+                and i.__qualname__ == target.__qualname__
+                and i.__bases__ == target.__bases__), None)
+        if original is None or target.__mro__[1:] != original.__mro__[1:]:
+            error = TypeError(
+                f'{repr(target)} not rebuilt from a disinherited type')
+            raise error
+        with cls._lock:
+            cls._rebind(target, original)
+            if original in cls._propagating: cls._propagating.add(target)
+            if original in cls._pending:
+                cls._pending[target] = cls._pending.pop(original)
+                return target
+        plan = cls._applied.get(original)
+        if plan is None or cls._applied.get(target) is plan: return target
+        namespace, copied = vars(target), vars(original)
+        if all(namespace.get(i) is copied[i] for i in (
+               *plan.blocked, '__dir__', '__getattr__', '__getattribute__')
+               if i in copied):
+            cls._applied[target] = plan
+            return target
+        markers = list(i for i in namespace.values() if type(i) is _Blocked)
+        return plan.apply(target, bool(markers),
+                          any(i.type_level for i in markers))
+
+    @classmethod
+    def in_subclass(cls, target: type) -> type:
+        """propagates disinheritance to a target type from its disinherited
+        bases (i.e., a subclass of a type disinherited with the propagate
+        keyword argument), computing only the delta of names owned by the
+        target type instead of introspecting the target type MRO
+        
+        - names blocked in disinherited bases remain blocked unless owned by
+          the target type, and exemptions applied in bases remain applied
+        - blocked names shadowed by other bases of the target type (i.e.,
+          preceding disinherited bases in the MRO) are blocked again, with
+          the first NotImplemented or descriptor in the MRO
+        - names of types in the target type MRO not covered by the MRO of
+          a disinherited base (e.g., mixins) are also blocked, unless
+          available in a disinherited base (i.e., owned or exempted), with
+          the value in the disinherited base exempted instead
+          -> the plan is then applied in full to the target type (see
+             DisinheritancePlan.apply), as with direct disinheritance
+        - __dir__, __getattribute__ and __init_subclass__ owned by the
+          target type are wrapped, so overrides retain disinheritance and
+          propagation
+        - plans are shared by target types with the same base MRO and
+          disinherited bases
+        """
+        cls._resolve_pending(target.__mro__[1:])
+        applied, bases = cls._applied, target.__bases__
+        plans = tuple(applied[i] for i in bases if i in applied)
+        if not plans or target in applied: return target
+        mro = target.__mro__[1:]
+        if len(bases) > 1:
+            covered = set(j for i in bases if i in applied for j in i.__mro__)
+            uncovered = tuple(i for i in mro if i not in covered)
+        else: uncovered = ()
+        key = mro, *plans
+        plan = cls._plans.get(key)
+        if plan is None:
+            blocked = frozenset().union(*(i.blocked for i in plans))
+            exempt = dict(j for i in plans for j in i.exempt)
+            if uncovered:
+                blocked = set(blocked)
+                names = frozenset().union(
+                    *cls._map_cached(uncovered).values())
+                for name in names - cls._get_required() - exempt.keys() - \
+                            {'__dict__', '__slots__'}:
+                    source = next((i for i in bases if i in applied
+                                   and name in cls._map_names(i)
+                                   and name not in applied[i].blocked), None)
+                    if source is None: blocked.add(name)
+                    else: exempt[name] = cls._get_static(source, name)
+                blocked = frozenset(blocked)
+            plan = DisinheritancePlan(mro, blocked, tuple(exempt.items()),
+                                      cls._get_required())
+            cls._plans[key] = plan
+        own = vars(target).keys()
+        if uncovered:
+            if '__init_subclass__' in own: cls._propagate(target)
+            markers = list(v for i in bases if i in applied
+                           for v in vars(i).values() if type(v) is _Blocked)
+            return plan.apply(target, bool(markers),
+                              any(i.type_level for i in markers))
+        if len(bases) > 1:
+            for name in plan.blocked - own:
+                values = (vars(i)[name] for i in mro if name in vars(i))
+                if cls._is_blocked(next(values, NotImplemented)): continue
+                value = next(filter(cls._is_blocked, values), NotImplemented)
+                setattr(target, name, value)
+        if '__init_subclass__' in own: cls._propagate(target)
+        applied[target] = plan
+        if cls._enforcement == 'off': return target
+        if '__dir__' in own: cls._wrap_dir(target)
+        if '__getattr__' in own: cls._wrap_getattr(target, plan.blocked - own)
+        if ('__getattribute__' in own or len(plans) > 1) and next(
+           vars(i)['__getattribute__'] for i in mro
+           if '__getattribute__' in vars(i)) in cls._wrappers:
+            cls._wrap_getter(target, plan.blocked - own)
+        return target
+
+    @classmethod
+    def in_types(cls, targets: list[type] | tuple[type] | set[type],
+                 exempt: type | MethodType | list[type | MethodType] |
+                 tuple[type | MethodType] | set[type | MethodType] = None,
+                 descriptor: bool = False, type_level: bool = False
+                 ) -> list[type]:
+        """disinherits methods/attributes from multiple target types (as
+        with in_type), returning the target types in order of disinheritance
+        
+        - target types are ordered by MRO length (i.e., ancestors before
+          derived types) and grouped by base MRO, so a plan is compiled
+          once for each distinct base MRO and applied to each target type
+        """
+        groups = dict()
+        targets = dict.fromkeys(targets)
+        for target in sorted(targets, key=lambda i: len(i.__mro__)):
+            cls._resolve_pending(target.__mro__)
+            groups.setdefault(target.__mro__[1:], list()).append(target)
+        for mro, group in groups.items():
+            plan = cls.compile(mro, exempt)
+            for target in group: plan.apply(target, descriptor, type_level)
+        return list(i for group in groups.values() for i in group)
+
+    @classmethod
+    def in_module(cls, module: ModuleType | dict, base: type,
+                  exempt: type | MethodType | list[type | MethodType] |
+                  tuple[type | MethodType] | set[type | MethodType] = None,
+                  descriptor: bool = False, type_level: bool = False
+                  ) -> list[type]:
+        """disinherits methods/attributes from all subclasses of a base
+        type defined in a module (or module namespace, e.g., globals()),
+        except for subclasses already disinherited or pending (as with
+        in_types)
+        """
+        namespace = vars(module) if isinstance(module, ModuleType) else module
+        name = namespace.get('__name__')
+        targets = list(
+            i for i in namespace.values() if isinstance(i, type)
+            and i is not base and issubclass(i, base)
+            and i.__module__ == name and i not in cls._applied
+            and i not in cls._pending)
+        return cls.in_types(targets, exempt, descriptor, type_level)
+
+    @classmethod
+    def compile(cls, base: type | tuple[type], exempt: type | MethodType |
+                list[type | MethodType] | tuple[type | MethodType] |
+                set[type | MethodType] = None,
+                _record: dict = None) -> 'DisinheritancePlan':
+        """compiles disinheritance of methods/attributes for subclasses of
+        a base type (or with a base MRO, i.e., the MRO of a target type
+        without the target type) to a plan applicable to target types
+        
+        - plans are shared for identical base MROs and exemptions, and
+          recompiled when names available in the base MRO change
+        """
+        mro = base.__mro__ if isinstance(base, type) else tuple(base)
+        mro_map = cls._time(_record, 'mapping', cls._map_cached, mro)
+        sources = tuple(mro_map.values())
+        if exempt is None: key = mro, ()
+        elif isinstance(exempt, (list, tuple, set)): key = mro, *exempt
+        else: key = mro, exempt
+        try: plan = cls._plans.get(key)
+        except TypeError: key = plan = None
+        if plan is not None and plan._sources == sources: return plan
+        plan_cache = cls._plan_cache
+        if plan_cache is not None:
+            fingerprint = cls._make_fingerprint(mro_map, exempt)
+            entry = plan_cache.load(fingerprint) if fingerprint else None
+        else: fingerprint = entry = None
+        if entry is not None:
+            try:
+                blocked = frozenset(entry['blocked'])
+                installs = dict(
+                    (name, (cls._get_static(mro[i], name), mro[i]))
+                    for name, i in entry['exempt'])
+            except Exception: entry = None
+        if entry is None:
+            exempt = cls._time(_record, 'coercion', cls._coerce_exempt,
+                               mro_map, exempt)
+            invalid = cls._time(_record, 'invalid', cls._get_invalid_names,
+                                mro_map, exempt)
+            installs = dict()
+            for source, exempt_map in exempt.items():
+                for name in exempt_map.keys() & invalid:
+                    installs[name] = cls._get_static(source, name), source
+            blocked = frozenset(invalid - installs.keys())
+            if fingerprint:
+                plan_cache.store(fingerprint, {
+                    'mro': list(map(cls._make_type_key, mro)),
+                    'blocked': sorted(blocked),
+                    'exempt': list([name, mro.index(source)] for name,
+                                   (_, source) in installs.items())})
+        plan = DisinheritancePlan(
+            mro, blocked, tuple((k, v) for k, (v, _) in installs.items()),
+            cls._get_required(), sources)
+        if key is not None: cls._plans[key] = plan
+        return plan
+
+    @classmethod
+    def disable_metrics(cls):
+        """disables counting of failed retrievals (see enable_metrics),
+        retaining counts and call sites for snapshots
+        """
+        cls._metrics = None
+        return
+
+    @classmethod
+    def disable_profiling(cls):
+        """disables profiling (see enable_profiling), retaining records"""
+        cls._profiling = None
+        return
+
+    @classmethod
+    def disable_plan_cache(cls):
+        """disables the on-disk cache of compiled plans"""
+        cls._plan_cache = None
+        return
+
+    @classmethod
+    def enable_metrics(cls, sample: int = 0):
+        """enables (and resets) counting of failed retrievals of
+        disinherited methods/attributes by type (i.e., of the instance or
+        type retrieved from) and name (see get_metrics)
+        
+        - counts are kept in per-thread tables, updated only where
+          retrieval fails (i.e., allowed retrieval is unaffected)
+        - with a sample rate, the call site (i.e., file name and line
+          number) of 1 in sample failed retrievals of each name is also
+          captured (see get_call_sites)
+        """
+        if not isinstance(sample, int) or sample < 0:
+            error = ValueError(
+                f'sample must be a non-negative int (got {repr(sample)})')
+            raise error
+        with cls._lock:
+            cls._local, cls._tables = local(), list()
+            cls._folded = WeakKeyDictionary(), WeakKeyDictionary()
+            cls._metrics = sample
+        return
+
+    @classmethod
+    def enable_profiling(cls, hook: Callable = None):
+        """enables (and resets) profiling of disinheritance of target types
+        (see in_type), recording a dictionary for each target type (see
+        get_profile), called with a hook (if any) as recorded
+        
+        - records contain:
+          -> type: module and qualified name of the target type
+          -> mro, blocked, exempt: MRO length, number of blocked names
+             and number of exemptions installed (i.e., from beyond the
+             first type in the base MRO owning each name)
+          -> mapping, coercion, invalid, wrapping: wall time in seconds
+             spent mapping the base MRO, coercing exemptions, identifying
+             invalid names and applying the plan (i.e., installing
+             overrides and wrapping), with coercion and invalid zero for
+             shared (or cached) plans
+          -> total: wall time in seconds spent disinheriting the target
+             type
+        - target types disinherited in bulk (see in_types) or propagated
+          to (see in_subclass) are not recorded
+        """
+        with cls._lock: cls._profiling = list(), hook
+        return
+
+    @classmethod
+    def enable_plan_cache(cls, path: str = None) -> PlanCache:
+        """enables the on-disk cache of compiled plans (opt-in), in a
+        cache directory path (or the default cache directory; see
+        PlanCache.default_path)
+        
+        - on a cache hit, compiling a plan validates the base MRO
+          fingerprint and loads stored names instead of identifying
+          invalid names and coercing exemptions
+          -> only that work is skipped, as the fingerprint is made from
+             names owned by each type in the base MRO, still read from
+             each type namespace on a cold start (see _map_cached)
+        - fingerprints include Python version, type keys (i.e., module
+          and qualified names) in the base MRO, hashes of names owned by
+          each type in the base MRO, and keys of exemptions
+        """
+        cls._plan_cache = PlanCache(path)
+        return cls._plan_cache
+
+    @classmethod
+    def get_call_sites(cls) -> dict[type, dict[str, dict[tuple, int]]]:
+        """returns a snapshot of sampled call sites of failed retrievals
+        (see enable_metrics), mapping types to names to pairs of file name
+        and line number to counts
+        """
+        return cls._merge_metrics(1)
+
+    @classmethod
+    def get_enforcement(cls) -> str:
+        """returns the active enforcement mode (see set_enforcement)"""
+        return cls._enforcement
+
+    @classmethod
+    def get_profile(cls) -> list[dict]:
+        """returns copies of profiling records in order of disinheritance
+        (see enable_profiling)
+        """
+        if cls._profiling is None: return list()
+        return list(map(dict, cls._profiling[0]))
+
+    @classmethod
+    def get_metrics(cls) -> dict[type, dict[str, int]]:
+        """returns a snapshot of counts of failed retrievals (see
+        enable_metrics), mapping types to names to counts (merged across
+        threads)
+        """
+        return cls._merge_metrics(0)
+
+    @classmethod
+    def set_enforcement(cls, mode: str, report: Callable = None,
+                        rate: float = 10.0):
+        """sets the enforcement mode for target types subsequently
+        disinherited, as 'strict' (default), 'audit' or 'off'
+        
+        - with 'off', plans are compiled, recorded and applied with
+          NotImplemented in place of disinherited methods/attributes
+          (shown in help() calls on target types), but no wrappers,
+          descriptors or metaclasses are installed, so retrieval from
+          target types and instances is as from undecorated subclasses
+        - with 'audit', plans are applied with NotImplemented and wrapped
+          __getattribute__ (i.e., without descriptors or metaclasses), and
+          retrieval of disinherited methods/attributes from instances is
+          reported and returns the inherited method/attribute
+          -> reports call report with the instance type, name and call
+             site (i.e., pair of file name and line number), or otherwise
+             issue a DisinheritedAccessWarning at the call site
+          -> reports are deduplicated by instance type, name and call
+             site, and limited to rate reports per second (with excess
+             reports dropped until reported within the limit)
+          -> special methods (i.e., names starting and ending with
+             "__", such as __len__, __iter__, __contains__, __getitem__
+             or __eq__) are not disinherited and cannot be audited, as
+             the interpreter calls them through type slots without
+             retrieval (and would otherwise fail calling NotImplemented)
+        - the mode applies when disinheritance is applied, so it must be
+          set before target types are defined (or, if deferred, first
+          instantiated)
+        - setting the mode resets deduplication and rate limiting of audit
+          reports
+        """
+        if mode not in cls._modes:
+            error = ValueError(
+                f'{repr(mode)} not a valid enforcement mode (expected one '
+                f'of {", ".join(map(repr, cls._modes))})')
+            raise error
+        with cls._lock:
+            cls._auditing, cls._reported = (report, rate), WeakKeyDictionary()
+            cls._enforcement, cls._window = mode, (0.0, 0)
+        return
+
+    @classmethod
+    def _audit(cls, obj: object, name: str):
+        """internal class method to report retrieval of a disinherited
+        method/attribute (i.e., blocked name) from an instance in audit
+        mode (see set_enforcement), unless already reported for the call
+        site or over the rate limit
+        """
+        owner, site = type(obj), cls._get_call_site()
+        reported = cls._reported.get(owner)
+        if reported is not None and (name, site) in reported: return
+        report, rate = cls._auditing
+        with cls._lock:
+            start, count = cls._window
+            now = monotonic()
+            if now - start >= 1.0: start, count = now, 0
+            if count >= rate: return
+            cls._window = start, count + 1
+            cls._reported.setdefault(owner, set()).add((name, site))
+        if report is not None: report(owner, name, site)
+        else:
+            warning = DisinheritedAccessWarning(
+                f'retrieval of disinherited attribute {repr(name)} from '
+                f'{repr(owner.__name__)} object')
+            warn_explicit(warning, DisinheritedAccessWarning, *site)
+        return
+
     @classmethod
     def _coerce_exempt(cls, mro_map: dict, exempt: type | MethodType |
-                       list | tuple | set = None) -> dict[str, dict]:
+                       list | tuple | set = None) -> dict[type, dict]:
         """internal class method to coerce exemptions for disinheritance
-        to a mapping of methods/attributes
+        to a mapping of types to methods/attributes
         """
         if exempt is None: return dict()
         elif not isinstance(exempt, (list, tuple, set)):
@@ -78,9 +715,9 @@ class disinherit:
         coerced = dict()
         for i in exempt:
             if isinstance(i, type):
-                coerced[cls._make_type_key(i)] = cls._map_type(i)
+                coerced[i] = cls._map_type(i)
             else: 
-                key = cls._make_type_key(i.__objclass__)
+                key = i.__objclass__
                 submap = {i.__name__: i}
                 try: coerced[key].update(submap)
                 except: coerced[key] = submap
@@ -89,40 +726,226 @@ class disinherit:
         return coerced
 
     @classmethod
-    def _get_invalid_names(cls, target: type, mro_map: dict,
-                           exempt: dict) -> set[str]:
+    def _count(cls, obj: object, name: str):
+        """internal class method to count a failed retrieval of a
+        disinherited method/attribute (i.e., blocked name) from an object
+        in the table of the current thread, and sample its call site
+        (i.e., the first frame outside of this module)
+        
+        - tables are held by the thread (i.e., its local) and referenced
+          weakly for merging, so tables of ended threads are folded when
+          released (see _fold_tables)
+        """
+        owner = obj if isinstance(obj, type) else type(obj)
+        try: counts, sites = cls._local.tables
+        except AttributeError:
+            counts, sites = WeakKeyDictionary(), WeakKeyDictionary()
+            cls._local.tables = counts, sites
+            entry = ref(counts), ref(sites)
+            finalize(counts, cls._fold_tables, entry, counts.data, sites.data)
+            with cls._lock: cls._tables.append(entry)
+        names = counts.get(owner)
+        if names is None: names = counts[owner] = dict()
+        count = names[name] = names.get(name, 0) + 1
+        sample = cls._metrics
+        if not sample or (count - 1) % sample: return
+        site = cls._get_call_site()
+        names = sites.get(owner)
+        if names is None: names = sites[owner] = dict()
+        names = names.setdefault(name, dict())
+        names[site] = names.get(site, 0) + 1
+        return
+
+    @classmethod
+    def _fold_tables(cls, entry: tuple, counts: dict, sites: dict):
+        """internal class method to fold the tables of counts and call
+        sites of an ended thread (i.e., their data, as the tables are
+        released) into the tables of ended threads, unless reset since
+        (see enable_metrics)
+        """
+        with cls._lock:
+            index = next((i for i, tables in enumerate(cls._tables)
+                          if tables is entry), None)
+            if index is None: return
+            del cls._tables[index]
+            for i, table in enumerate((counts, sites)):
+                cls._merge_table(cls._folded[i], table, i)
+        return
+
+    @classmethod
+    def _get_call_site(cls) -> tuple[str, int]:
+        """internal class method to return the call site (i.e., pair of
+        file name and line number) of the first frame outside of this
+        module
+        """
+        frame = sys._getframe(1)
+        while frame.f_back and frame.f_code.co_filename == __file__:
+            frame = frame.f_back
+        return frame.f_code.co_filename, frame.f_lineno
+
+    @classmethod
+    def _get_inherited(cls, obj: object, name: str) -> object:
+        """internal class method to return an inherited method/attribute
+        from an instance (i.e., the first in the instance type MRO not
+        blocked) for audit mode (see set_enforcement)
+        """
+        owner = type(obj)
+        for i in owner.__mro__:
+            namespace = vars(i)
+            if name not in namespace or cls._is_blocked(namespace[name]):
+                continue
+            value = namespace[name]
+            getter = getattr(type(value), '__get__', None)
+            return value if getter is None else getter(value, obj, owner)
+        error = DisinheritedAttributeError()
+        error.name, error.obj = name, obj
+        raise error
+
+    @classmethod
+    def _get_invalid_names(cls, mro_map: dict, exempt: dict) -> set[str]:
         """internal class method to identify names of methods/attributes
-        considered invalid in the target subclass (unless part of exempted
-        methods/attributes)
-        """
-        *ancestor_keys, _ = list(mro_map)[1:]
-        required = set(
-            i for i in cls._map_type(object) if len(i.strip('_')) > 2)
-        valid, invalid = set(vars(target)), set()
-        for key in ancestor_keys:
-            type_invalid = dict(
-                (name, value) for name, value in mro_map[key].items()
-                if all((name not in required, name not in valid,
-                        name not in exempt.get(key, set()),
-                        name != '__dict__')))
-            invalid |= set(type_invalid)
+        considered invalid in subclasses of a base MRO (unless part of
+        exempted methods/attributes or owned by a subclass)
+        
+        - names available in an ancestor are equivalent to dir() on the
+          ancestor, so names owned by each type in the MRO of ancestors
+          without exemptions are merged once (i.e., types already covered
+          by the MRO of a preceding ancestor are skipped)
+        - __dict__ and __slots__ are never invalid, as __slots__ is only
+          read when a type is created (i.e., assigning it would not change
+          a target type, but would prevent rebuilding it with slots)
+        """
+        *ancestors, _ = mro_map
+        invalid, merged = set(), set()
+        for ancestor in ancestors:
+            if ancestor in exempt:
+                invalid |= cls._map_names(ancestor, mro_map) - \
+                           exempt[ancestor].keys()
+            elif ancestor not in merged:
+                for i in ancestor.__mro__:
+                    if i in merged: continue
+                    merged.add(i)
+                    invalid |= mro_map[i]
+        invalid -= cls._get_required()
+        invalid.difference_update(('__dict__', '__slots__'))
         return invalid
 
+    @classmethod
+    def _get_required(cls) -> frozenset[str]:
+        """internal class method to identify names of functionally required
+        "origin" object methods/attributes (i.e., excluding rich comparison
+        methods) and __getattr__ (as NotImplemented would be called for
+        missing names); cached once as the object namespace is immutable
+        """
+        if cls._required is None:
+            cls._required = frozenset(
+                i for i in vars(object) if len(i.strip('_')) > 2
+            ) | {'__getattr__'}
+        return cls._required
+
+    @classmethod
+    def _get_static(cls, target: type, name: str) -> object:
+        """internal class method to retrieve a method/attribute by name as
+        owned by the first type in the target type MRO owning the name
+        (i.e., without invoking descriptors), as installed for exemptions
+        
+        - classmethods, staticmethods, properties and other descriptors
+          are installed as is, so exemptions bind to the target type
+        """
+        for i in target.__mro__:
+            namespace = vars(i)
+            if name in namespace: return namespace[name]
+        error = AttributeError(
+            f'type object {repr(target.__name__)} has no attribute '\
+            f'{repr(name)}')
+        raise error
+
+    @classmethod
+    def _get_type(cls, target: type) -> type:
+        """internal class method to return a metaclass for a target type
+        filtering dir() calls on the target type (i.e., DisinheritedType
+        or a subclass of DisinheritedType and the target type metaclass),
+        cached by metaclass
+        """
+        base = type(target)
+        if issubclass(base, DisinheritedType): return base
+        derived = cls._types.get(base)
+        if derived is None:
+            derived = DisinheritedType(
+                f'Disinherited{base.__name__}', (DisinheritedType, base),
+                {'__module__': base.__module__})
+            cls._types[base] = derived
+        return derived
+
+    @classmethod
+    def _get_visible(cls, target: type) -> frozenset[str]:
+        """internal class method to identify names of methods/attributes
+        available in a target type and not disinherited (i.e., not
+        resolved to NotImplemented or descriptors in the target type MRO),
+        cached by type until names available in the target type change
+        (i.e., computed on the first dir() call, not when plans are applied)
+        
+        - disinherited names are cached with their markers (grouped by
+          MRO index of the owning type), so replacing a marker with another
+          value (e.g., assigning a method to the target type) is detected
+          without a change in names
+        """
+        names = cls._map_names(target)
+        cached = cls._visible.get(target)
+        mro = target.__mro__
+        if cached is not None and cached[0] is names and all(
+           v.items() <= vars(mro[k]).items() for k, v in cached[2]):
+            return cached[1]
+        visible, hidden, seen = set(), dict(), set()
+        for k, i in enumerate(mro):
+            namespace = vars(i)
+            for name in namespace.keys() - seen:
+                value = namespace[name]
+                if cls._is_blocked(value):
+                    hidden.setdefault(k, dict())[name] = value
+                else: visible.add(name)
+            seen.update(namespace)
+        visible = frozenset(visible)
+        cls._visible[target] = names, visible, tuple(hidden.items())
+        return visible
+
+    @classmethod
+    def _is_blocked(cls, value: object) -> bool:
+        """internal class method to identify values of disinherited
+        methods/attributes (i.e., NotImplemented or descriptors) in type
+        namespaces
+        """
+        return value is NotImplemented or type(value) is _Blocked or \
+               type(value) is _Unsupported
+
+    @classmethod
+    def _is_deferred(cls, obj: object, name: str) -> bool:
+        """internal class method to identify failed retrievals of a
+        disinherited method/attribute (i.e., blocked name) from an object
+        counted by a wrapped __getattr__ of its type instead (i.e., called
+        after the AttributeError), so each retrieval is counted once
+        
+        - only deferred with strict enforcement, as retrieval otherwise
+          returns the inherited method/attribute (see set_enforcement)
+        """
+        if cls._enforcement != 'strict': return False
+        getattr_base = getattr(type(obj), '__getattr__', None)
+        if getattr_base is None: return False
+        return getattr_base in cls._wrappers and \
+               name in cls._wrappers[getattr_base][1]
+
     @classmethod
     def _make_type_key(cls, target: type) -> str:
-        """internal class method to create a nominally unique key for a
-        target type based on its module file location (or module name)
-        and its own name; intended to account for conflicting type names
-        in a target MRO
+        """internal class method to create a stable key for a target type
+        based on its module name and qualified name, where a type must be
+        referenced outside of the current process (types are otherwise
+        keyed by identity)
         """
         if not isinstance(target, type):
             error = TypeError(f'{repr(target)} not a valid type')
             raise error
         try:
-            name = target.__name__
-            try: source = getabsfile(target)
-            except: source = getmodule(target).__name__
-            return f'{source}->{repr(name)}'
+            return f'{target.__module__}:{target.__qualname__}'
         except Exception as e:
             error = TypeError(
                 f'cannot determine origin of {repr(target)} as a type')
@@ -130,50 +953,609 @@ class disinherit:
         return
 
     @classmethod
-    def _map_mro(cls, target: type) -> dict:
-        """internal class method to map the MRO of a target type with
-        nominally unique key references for types and associated method/
-        attribute mappings by name and value
+    def _make_fingerprint(cls, mro_map: dict, exempt: type | MethodType |
+                          list | tuple | set = None) -> str | None:
+        """internal class method to create a fingerprint of a base MRO and
+        exemptions for the on-disk cache of compiled plans, or None where
+        exemptions cannot be keyed outside of the current process
+        """
+        if exempt is None: exempt = ()
+        elif not isinstance(exempt, (list, tuple, set)): exempt = exempt,
+        digests, exempt_keys = cls._digests, list()
+        for i in exempt:
+            try:
+                if isinstance(i, type): exempt_keys.append(
+                    cls._make_type_key(i))
+                elif hasattr(i, '__objclass__'): exempt_keys.append(
+                    f'{cls._make_type_key(i.__objclass__)}.{i.__name__}')
+            except Exception: return None
+        if isinstance(exempt, set): exempt_keys.sort()
+        fingerprint = sha256(PlanCache.python.encode() + b'\0' + _FORMAT)
+        for i, own in mro_map.items():
+            cached = digests.get(i)
+            if cached is None or cached[0] is not own:
+                digest = sha256('\0'.join(sorted(own)).encode()).digest()
+                digests[i] = cached = own, digest
+            fingerprint.update(cls._make_type_key(i).encode() + b'\0')
+            fingerprint.update(cached[1])
+        fingerprint.update('\0'.join(exempt_keys).encode())
+        return fingerprint.hexdigest()
+
+    @classmethod
+    def _map_cached(cls, mro: tuple) -> dict:
+        """internal class method to map types in an MRO (in order) to
+        cached names of methods/attributes owned by each type, refreshing
+        stale cache entries
+        
+        - an entry is stale if the type bases or owned names have changed
+          (i.e., compared by name, so names replaced without changing
+          their number are detected)
+          -> owned names of immutable types (e.g., builtins) are not
+             compared, as they cannot change
+        - names available in a type are not cached per entry (see
+          _map_names), so mapping an MRO is linear in its length
         """
-        return dict((cls._make_type_key(i), cls._map_type(i))
-                    for i in target.mro())
+        cache, mapped = cls._cache, dict()
+        for i in mro:
+            bases = i.__bases__
+            cached = cache.get(i)
+            if cached is None or cached[0] is not bases or \
+               not i.__flags__ & _IMMUTABLE and cached[1] != vars(i).keys():
+                cached = cache[i] = bases, frozenset(vars(i))
+            mapped[i] = cached[1]
+        return mapped
+
+    @classmethod
+    def _map_names(cls, target: type, mro_map: dict = None
+                   ) -> frozenset[str]:
+        """internal class method to return names of methods/attributes
+        available in a target type (equivalent to dir() on the target
+        type), merged from cached names owned by each type in the target
+        type MRO (or mapped in an MRO map including it; see _map_cached)
+        
+        - merged names are cached by target type until names owned by a
+          type in the target type MRO change
+        """
+        mro = target.__mro__
+        if mro_map is None: mro_map = cls._map_cached(mro)
+        owned = tuple(mro_map[i] for i in mro)
+        cached = cls._available.get(target)
+        if cached is not None and cached[0] == owned: return cached[1]
+        names = frozenset().union(*owned)
+        cls._available[target] = owned, names
+        return names
 
     @classmethod
     def _map_type(cls, target: type) -> dict:
         """internal class method to return mapping of names and associated
-        methods/attributes for a target type
+        methods/attributes for a target type, as owned by the first type
+        in the target type MRO owning each name (i.e., without retrieval
+        from the target type invoking descriptors or metaclass hooks)
+        
+        - methods/attributes are installed by plans as owned (e.g., as
+          classmethod or property objects; see _get_static)
+        """
+        mapped = dict()
+        for i in reversed(target.__mro__): mapped.update(vars(i))
+        return mapped
+
+    @classmethod
+    def _merge_metrics(cls, index: int) -> dict:
+        """internal class method to merge per-thread tables (and tables of
+        ended threads) of counts (at index 0) or call sites (at index 1)
+        into a snapshot
+        """
+        merged = dict()
+        with cls._lock:
+            cls._merge_table(merged, cls._folded[index].data, index)
+            for tables in tuple(cls._tables):
+                table = tables[index]()
+                if table is not None:
+                    cls._merge_table(merged, table.data, index)
+        return merged
+
+    @classmethod
+    def _merge_table(cls, merged: dict, table: dict, index: int):
+        """internal class method to merge a table of counts (at index 0)
+        or call sites (at index 1), as a mapping of weak references to
+        types, into a mapping of types
+        
+        - tables are copied before merging, as other threads may update
+          them during merging
+        """
+        for key, names in dict(table).items():
+            owner = key()
+            if owner is None: continue
+            into = merged.setdefault(owner, dict())
+            for name, value in dict(names).items():
+                if not index:
+                    into[name] = into.get(name, 0) + value
+                    continue
+                sites = into.setdefault(name, dict())
+                for site, count in dict(value).items():
+                    sites[site] = sites.get(site, 0) + count
+        return
+
+    @classmethod
+    def _profile(cls, target: type, exempt: type | MethodType | list |
+                 tuple | set = None, descriptor: bool = False,
+                 type_level: bool = False) -> type:
+        """internal class method to disinherit a target type (as with
+        in_type) while recording a profiling record (see enable_profiling)
+        """
+        records, hook = cls._profiling
+        timings = dict.fromkeys(('mapping', 'coercion', 'invalid'), 0.0)
+        start = perf_counter()
+        plan = cls.compile(target.__mro__[1:], exempt, _record=timings)
+        cls._time(timings, 'wrapping', plan.apply, target, descriptor,
+                  type_level)
+        total = perf_counter() - start
+        record = dict(type=f'{target.__module__}.{target.__qualname__}',
+                      mro=len(target.__mro__), blocked=len(plan.blocked),
+                      exempt=len(plan.exempt), **timings, total=total)
+        records.append(record)
+        if hook is not None: hook(record)
+        return target
+
+    @classmethod
+    def _propagate(cls, target: type):
+        """internal class method to wrap __init_subclass__ in the target
+        type to propagate disinheritance to subclasses (see in_subclass),
+        detecting types rebuilt from the target type (see in_rebuilt)
+        """
+        init_subclass_base = vars(target).get('__init_subclass__')
+        def __init_subclass__(subclass, **kwargs):
+            if target not in subclass.__mro__:
+                rebuilt = next((
+                    i for i in subclass.__mro__ if getattr(
+                        vars(i).get('__init_subclass__'), '__func__', None)
+                    is __init_subclass__), None)
+                if rebuilt is not None: cls.in_rebuilt(rebuilt, target)
+            if init_subclass_base is None:
+                super(target, subclass).__init_subclass__(**kwargs)
+            else: init_subclass_base.__get__(None, subclass)(**kwargs)
+            cls.in_subclass(subclass)
+            return
+        target.__init_subclass__ = classmethod(__init_subclass__)
+        cls._propagating.add(target)
+        return
+
+    @classmethod
+    def _rebind(cls, target: type, original: type = None):
+        """internal class method to rebind __class__ closures (i.e., of
+        zero-argument super() calls) of methods/attributes owned by a
+        target type (i.e., functions, classmethod and staticmethod
+        functions, and property accessors) from an original type (or, if
+        not given, any other type with the module, qualified name and
+        bases of the target type, i.e., a type the target type was
+        rebuilt from) to the target type
+        
+        - zero-argument super() calls reference the defining type by
+          closure (i.e., __class__), so fail in types rebuilt from it
+          (e.g., by dataclass with slots=True before Python 3.12)
+        - other closures are not rebound (e.g., closures of functions
+          defined in factories referencing types defined previously),
+          except for target closures of wrappers defined in this module
+          (see in_type_lazy and _propagate)
+        """
+        def rebuilt_from(value: object) -> bool:
+            if original is not None: return value is original
+            return isinstance(value, type) and value is not target and \
+                   value.__qualname__ == target.__qualname__ and \
+                   value.__module__ == target.__module__ and \
+                   value.__bases__ == target.__bases__
+        for value in vars(target).values():
+            if isinstance(value, property):
+                functions = value.fget, value.fset, value.fdel
+            elif isinstance(value, (classmethod, staticmethod)):
+                functions = value.__func__,
+            else: functions = value,
+            for function in functions:
+                if not isinstance(function, FunctionType) or \
+                   not function.__closure__: continue
+                code = function.__code__
+                names = ('__class__', 'target') \
+                        if code.co_filename == __file__ else ('__class__',)
+                for name, cell in zip(code.co_freevars, function.__closure__):
+                    if name not in names: continue
+                    try:
+                        if rebuilt_from(cell.cell_contents):
+                            cell.cell_contents = target
+                    except ValueError: pass
+        return
+
+    @classmethod
+    def _rebuild(cls, target: type,
+                 slots: str | list[str] | tuple[str] | None = None,
+                 metaclass: type = None) -> type:
+        """internal class method to rebuild a target type with __slots__
+        (unless None, or declared in the target type) and/or a metaclass
+        (or the target type metaclass), with the name, qualified name,
+        bases and namespace of the target type (or return the target type
+        where neither applies)
+        
+        - methods referencing the target type by closure (i.e., __class__
+          for zero-argument super() calls) are rebound to the rebuilt type
+          (see _rebind)
+        - __init_subclass__ of bases and __set_name__ of descriptors are
+          called again for the rebuilt type, but class keyword arguments
+          are not retained
+        - instances have no __dict__ only where all bases are slotted, and
+          no __weakref__ unless included in slots
+        """
+        namespace = dict(vars(target))
+        if '__slots__' in namespace: slots = None
+        if slots is None and metaclass is None: return target
+        for name in '__dict__', '__weakref__': namespace.pop(name, None)
+        if slots is not None: namespace['__slots__'] = slots
+        namespace['__qualname__'] = target.__qualname__
+        if metaclass is None: metaclass = type(target)
+        rebuilt = metaclass(target.__name__, target.__bases__, namespace)
+        cls._rebind(rebuilt, target)
+        return rebuilt
+
+    @classmethod
+    def _resolve_pending(cls, types: tuple):
+        """internal class method to apply deferred disinheritance to types
+        pending from in_type_lazy, restoring the original __init__ and
+        __getattribute__ of each type beforehand
+        """
+        if not cls._pending: return
+        with cls._lock:
+            for target in types:
+                try: *options, init_base, getter_base = \
+                     cls._pending.pop(target)
+                except KeyError: continue
+                for name, base in (('__init__', init_base),
+                                   ('__getattribute__', getter_base)):
+                    if base is None: delattr(target, name)
+                    else: setattr(target, name, base)
+                cls.in_type(target, *options)
+        return
+
+    @classmethod
+    def _time(cls, record: dict | None, phase: str, function: Callable,
+              *args) -> object:
+        """internal class method to call a function with arguments, adding
+        the wall time of the call to a phase of a profiling record (if
+        any; see enable_profiling)
         """
-        return dict((name, getattr(target, name)) for name in dir(target))
+        if record is None: return function(*args)
+        start = perf_counter()
+        try: return function(*args)
+        finally:
+            record[phase] = record.get(phase, 0.0) + perf_counter() - start
 
     @classmethod
     def _wrap_dir(cls, target: type) -> object.__dir__:
         """internal class method to wrap __dir__ in the target type to
-        prevent return of disinherited methods/attributes
+        prevent return of disinherited methods/attributes, unless already
+        wrapped in the target type or a base
+        
+        - where not overridden, __dir__ returns cached names of the
+          instance type (see _get_visible) with instance attribute names
+          instead of retrieving each name
+        - where overridden, names returned by the original __dir__ are
+          filtered by cached names instead of retrieval, retaining names
+          assigned in instances or not available in the instance type
         """
         dir_base = target.__dir__
-        @wraps(dir_base)
-        def __dir__(self) -> list[str]:
-            return list(i for i in dir_base(self) if
-                        getattr(self, i, NotImplemented) is not
-                        NotImplemented)
-        if __dir__ != dir_base: target.__dir__ = __dir__
+        if dir_base in cls._wrappers: return
+        if dir_base is object.__dir__:
+            @wraps(dir_base)
+            def __dir__(self) -> list[str]:
+                visible = cls._get_visible(type(self))
+                try: return list(visible.union(vars(self)))
+                except TypeError: return list(visible)
+        else:
+            @wraps(dir_base)
+            def __dir__(self) -> list[str]:
+                names = cls._map_names(type(self))
+                visible = cls._get_visible(type(self))
+                try: own = vars(self).keys()
+                except TypeError: own = ()
+                return list(i for i in dir_base(self) if i in visible
+                            or i in own or i not in names)
+        cls._wrappers[__dir__] = dir_base, None
+        target.__dir__ = __dir__
         return
 
     @classmethod
-    def _wrap_getter(cls, target: type):
+    def _wrap_getattr(cls, target: type, blocked: frozenset[str]):
+        """internal class method to wrap __getattr__ in the target type (if
+        any) to prevent fallback retrieval of disinherited methods/
+        attributes (i.e., blocked names), unless already wrapped for the
+        blocked names in the target type or a base
+        
+        - disinherited __getattr__ (e.g., as assigned NotImplemented in the
+          target type) is not wrapped
+        """
+        getattr_base = getattr(target, '__getattr__', None)
+        if getattr_base is None or cls._is_blocked(getattr_base): return
+        if getattr_base in cls._wrappers:
+            wrapped = cls._wrappers[getattr_base]
+            if blocked <= wrapped[1]: return
+            getattr_base, blocked = wrapped[0], blocked | wrapped[1]
+        @wraps(getattr_base)
+        def __getattr__(self, name: str):
+            if name not in blocked: return getattr_base(self, name)
+            if cls._metrics is not None: cls._count(self, name)
+            if cls._enforcement == 'audit':
+                cls._audit(self, name)
+                return getattr_base(self, name)
+            error = DisinheritedAttributeError()
+            error.name, error.obj = name, self
+            raise error
+        cls._wrappers[__getattr__] = getattr_base, blocked
+        target.__getattr__ = __getattr__
+        return
+
+    @classmethod
+    def _wrap_getter(cls, target: type, blocked: frozenset[str]):
         """internal class method to wrap __getattribute__ in the target
-        type to prevent return of disinherited methods/attributes
+        type to prevent return of disinherited methods/attributes (i.e.,
+        blocked names), unless already wrapped for the blocked names in
+        the target type or a base
+        
+        - only retrieval of blocked names is checked for NotImplemented
+          (or other markers), other names are retrieved after one
+          membership check
+          -> blocked names are not short-circuited, as overrides in
+             subclasses and instance attributes are only found by the
+             full base lookup, so failed retrievals cost that lookup and
+             the check (see benchmarks/getter.py)
+        - wrappers in the target type or a base not covering the blocked
+          names are replaced (not wrapped), combining blocked names
         """
         getter_base = target.__getattribute__
+        if getter_base in cls._wrappers:
+            wrapped = cls._wrappers[getter_base]
+            if blocked <= wrapped[1]: return
+            getter_base, blocked = wrapped[0], blocked | wrapped[1]
         @wraps(getter_base)
         def __getattribute__(self, name: str):
+            if name not in blocked: return getter_base(self, name)
             result = getter_base(self, name)
-            if result is NotImplemented:
-                error = AttributeError(
-                    f'{repr(type(self).__name__)} object has no '\
-                    f'attribute {repr(name)}')
+            if result is NotImplemented or \
+               type(result) is _NotSupported or \
+               result is None and name in _MARKERS:
+                if cls._metrics is not None and \
+                   not cls._is_deferred(self, name):
+                    cls._count(self, name)
+                if cls._enforcement == 'audit':
+                    cls._audit(self, name)
+                    return cls._get_inherited(self, name)
+                error = DisinheritedAttributeError()
+                error.name, error.obj = name, self
                 raise error
             return result
-        if __getattribute__ != getter_base:
-            target.__getattribute__ = __getattribute__    
+        cls._wrappers[__getattribute__] = getter_base, blocked
+        target.__getattribute__ = __getattribute__
+        return
+
+
+class DisinheritancePlan:
+
+    """immutable plan of disinheritance compiled for a base MRO and
+    exemptions (see disinherit.compile), applicable to any target type
+    with the same base MRO
+    
+    - blocked names are replaced with NotImplemented (or descriptors
+      raising an AttributeError from instances) in a target type, except
+      for operator and protocol methods (see _Unsupported)
+    - exempt pairs of names and methods/attributes are installed in a
+      target type
+    - names owned by a target type are neither blocked nor exempted
+    - required names of "origin" object methods/attributes are retained
+    """
+
+    __slots__ = 'mro', 'blocked', 'exempt', 'required', '_sources', \
+                '__weakref__'
+
+    def __init__(self, mro: tuple[type], blocked: frozenset[str],
+                 exempt: tuple[tuple[str, object]], required: frozenset[str],
+                 _sources: tuple[frozenset[str]] = ()):
+        for name, value in zip(self.__slots__[:-1],
+                               (mro, blocked, exempt, required, _sources)):
+            object.__setattr__(self, name, value)
         return
+
+    def __setattr__(self, name: str, value: object):
+        error = AttributeError(
+            f'{repr(type(self).__name__)} object is immutable')
+        raise error
+
+    def __delattr__(self, name: str):
+        self.__setattr__(name, None)
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} for {repr(self.mro[0])}: '\
+               f'{len(self.blocked)} blocked, {len(self.exempt)} exempt>'
+
+    def apply(self, target: type, descriptor: bool = False,
+              type_level: bool = False) -> type:
+        """applies the plan to a target type with the plan base MRO, with
+        names owned by the target type left unchanged (except for blocked
+        names assigned NotImplemented where applied with descriptors)
+        
+        - type_level (implying descriptor) applies descriptors producing
+          an AttributeError when retrieved from the target type, and
+          replaces the target type metaclass (where mutable) to filter
+          dir() calls on the target type (see disinherit)
+        - with enforcement off (see disinherit.set_enforcement), only
+          NotImplemented (and operator/protocol markers) are applied, and
+          with enforcement in audit, NotImplemented (except for special
+          methods, left inherited) and wrappers are applied
+        """
+        if target.__mro__[1:] != self.mro:
+            error = TypeError(
+                f'{repr(target)} does not have the base MRO of {self}')
+            raise error
+        namespace = vars(target)
+        own = namespace.keys()
+        mode = disinherit._enforcement
+        descriptor = (descriptor or type_level) and mode == 'strict'
+        for name in self.blocked:
+            if name in own and namespace[name] is not NotImplemented:
+                continue
+            if mode == 'audit' and name.startswith('__') and \
+               name.endswith('__'):
+                if name in own: delattr(target, name)
+            elif name in _MARKERS: setattr(target, name, _MARKERS[name])
+            elif descriptor: setattr(target, name, _Blocked(name, type_level))
+            elif name not in own: setattr(target, name, NotImplemented)
+        for name, value in self.exempt:
+            if name not in own: setattr(target, name, value)
+        disinherit._applied[target] = self
+        if mode == 'off': return target
+        disinherit._wrap_dir(target)
+        blocked = frozenset(i for i in self.blocked
+                            if disinherit._is_blocked(namespace.get(i)))
+        disinherit._wrap_getattr(target, blocked)
+        if not descriptor: disinherit._wrap_getter(target, blocked)
+        elif type_level and not type(target).__flags__ & _IMMUTABLE:
+            target.__class__ = disinherit._get_type(target)
+        return target
+
+
+class _Blocked:
+
+    """internal non-data descriptor replacing a disinherited method/
+    attribute, raising an AttributeError when retrieved from instances
+    and returning NotImplemented when retrieved from the owner type (so
+    help() shows the method/attribute as not implemented), unless type
+    level (also raising an AttributeError)
+    
+    - as a non-data descriptor, instance assignments take precedence and
+      deletion from instances reverts back to disinheritance
+    """
+
+    __slots__ = 'name', 'type_level'
+
+    def __init__(self, name: str, type_level: bool = False):
+        self.name = name
+        self.type_level = type_level
+        return
+
+    def __repr__(self) -> str:
+        return f'<disinherited {repr(self.name)}>'
+
+    def __get__(self, instance: object, owner: type = None):
+        if instance is None:
+            if not self.type_level: return NotImplemented
+            instance = owner
+        if disinherit._metrics is not None and \
+           not disinherit._is_deferred(instance, self.name):
+            disinherit._count(instance, self.name)
+        error = DisinheritedAttributeError()
+        error.name, error.obj = self.name, instance
+        raise error
+
+
+class _NotSupported(partial):
+
+    """internal callable wrapped by _Unsupported, returning NotImplemented
+    for binary operator and rich comparison methods (without a Python
+    frame, as a partial object.__subclasshook__), or raising a TypeError
+    for other protocol methods (as a partial _NotSupported.fail)
+    """
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return 'NotImplemented'
+
+    @staticmethod
+    def fail(name: str, *args):
+        error = TypeError(f'disinherited {repr(name)} is not supported')
+        raise error
+
+
+class _Unsupported(staticmethod):
+
+    """internal static method replacing disinherited methods called by the
+    interpreter through type slots, returned unbound where retrieved (as
+    partial objects are method descriptors from Python 3.14, and warn as
+    class attributes in Python 3.13)
+    
+    - binary operator and rich comparison methods wrap a callable
+      returning NotImplemented (see _NotSupported), so operations fall
+      back to reflected methods of other operands as with types not
+      supporting them
+    - __contains__, __iter__ and __reversed__ wrap None, so the type is
+      reported as not a container, iterable or reversible
+    - other protocol methods (e.g., __len__) wrap a callable raising a
+      TypeError (rather than calling NotImplemented)
+    - shown as the wrapped value (e.g., in help() calls on a target type)
+    - retrieval from instances produces an AttributeError where
+      __getattribute__ is wrapped, but not with descriptor keyword
+      arguments (as operations would otherwise fail with an
+      AttributeError)
+    """
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return repr(self.__func__)
+
+
+class DisinheritedAttributeError(AttributeError):
+
+    """AttributeError for retrieval of a disinherited method/attribute
+    from an instance, with name and obj set and the message formatted
+    lazily (i.e., not where suppressed, as with hasattr() or getattr()
+    with a default)
+    
+    - name and obj are assigned after instantiation, as keyword arguments
+      are comparatively slow to parse
+    """
+
+    def __str__(self) -> str:
+        if isinstance(self.obj, type):
+            return f'type object {repr(self.obj.__name__)} has no '\
+                   f'attribute {repr(self.name)}'
+        return f'{repr(type(self.obj).__name__)} object has no attribute '\
+               f'{repr(self.name)}'
+
+
+class DisinheritedAccessWarning(UserWarning):
+
+    """warning for retrieval of a disinherited method/attribute from an
+    instance in audit mode (see disinherit.set_enforcement), issued at the
+    call site
+    """
+
+
+class DisinheritedType(type):
+
+    """metaclass excluding disinherited methods/attributes from dir()
+    calls on types (see type_level keyword argument of disinherit),
+    without overriding retrieval from types
+    
+    - names returned by the base __dir__ are filtered by cached names of
+      the type (see disinherit._get_visible)
+    """
+
+    def __dir__(cls) -> list[str]:
+        names = disinherit._map_names(cls)
+        visible = disinherit._get_visible(cls)
+        return list(i for i in super().__dir__()
+                    if i in visible or i not in names)
+
+
+_MARKERS = dict.fromkeys(
+    _OPERATORS, _Unsupported(_NotSupported(object.__subclasshook__))) | \
+    dict.fromkeys(('__contains__', '__iter__', '__reversed__'),
+                  _Unsupported(None)) | \
+    dict((i, _Unsupported(_NotSupported(_NotSupported.fail, i)))
+         for i in _PROTOCOLS - {'__contains__', '__iter__', '__reversed__'})
+
+
+if os.environ.get('DISINHERITANCE_CACHE_DIR'): disinherit.enable_plan_cache()
+if os.environ.get('DISINHERITANCE_ENFORCEMENT'):
+    try:
+        disinherit.set_enforcement(
+            os.environ['DISINHERITANCE_ENFORCEMENT'].strip().lower())
+    except ValueError as error:
+        warn(f'{error} in DISINHERITANCE_ENFORCEMENT, using \'strict\'',
+             RuntimeWarning)
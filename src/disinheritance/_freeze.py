@@ -0,0 +1,225 @@
+"""module for ahead-of-time ("frozen") disinheritance of subclassed object
+types, generating modules with explicit overrides in place of runtime
+introspection
+"""
+
+
+import ast
+import importlib
+import importlib.util
+import inspect
+from keyword import iskeyword
+
+from ._disinherit import DisinheritedType
+from ._disinherit import _Blocked
+from ._disinherit import _OPERATORS
+from ._disinherit import disinherit
+
+
+__all__ = 'freeze_module', 'verify_frozen'
+
+
+def freeze_module(name: str) -> str:
+    """imports a module by name and returns the source of an equivalent
+    frozen module, where types disinherited in the module are defined with
+    explicit NotImplemented assignments and applied exemptions (see
+    disinherit.in_type_frozen) instead of disinherit decorators
+
+    - decorators referencing disinherit are removed from frozen types,
+      with __slots__ declared where applied by disinherit (see slots
+      keyword argument of disinherit), and DisinheritedType declared as
+      the metaclass where rebuilt with it (see type_level keyword
+      argument of disinherit)
+    - types defined in function scopes are not frozen
+    - undecorated subclasses of types disinherited with the propagate
+      keyword argument are not frozen, as propagation is reapplied to them
+      at import (see disinherit.in_subclass)
+    - binary operator and rich comparison methods are assigned by
+      disinherit.in_type_frozen rather than in frozen type bodies, as
+      defining __eq__ in a type body sets __hash__ to None
+    - comments and formatting of the module source are not retained
+    """
+    module = importlib.import_module(name)
+    targets = _find_targets(module)
+    tree = ast.parse(inspect.getsource(module))
+    freezer = _Freezer(targets)
+    freezer.visit(tree)
+    body, index = tree.body, 0
+    if body and isinstance(body[0], ast.Expr) and \
+       isinstance(body[0].value, ast.Constant) and \
+       isinstance(body[0].value.value, str):
+        index = 1
+    while index < len(body) and isinstance(body[index], ast.ImportFrom) \
+          and body[index].module == '__future__':
+        index += 1
+    names = [ast.alias('disinherit', '_disinherit')]
+    if freezer.typed:
+        names.append(ast.alias('DisinheritedType', '_DisinheritedType'))
+    body.insert(index, ast.ImportFrom('disinheritance', names, 0))
+    header = f'# frozen from {name} by python -m disinheritance freeze; '\
+             f'do not edit\n'
+    return header + ast.unparse(ast.fix_missing_locations(tree)) + '\n'
+
+
+def verify_frozen(name: str, path: str) -> list[str]:
+    """compares types disinherited in a module (by name) with those in a
+    frozen module (by file path), returning descriptions of differences in
+    disinherited names, applied exemptions, dir() results, guards and
+    special methods
+    """
+    live = importlib.import_module(name)
+    targets = _find_targets(live)
+    spec = importlib.util.spec_from_file_location(name, path)
+    frozen = importlib.util.module_from_spec(spec)
+    frozen.__package__ = live.__package__
+    spec.loader.exec_module(frozen)
+    differences = list()
+    for qualname, target in targets.items():
+        other = frozen
+        try:
+            for i in qualname.split('.'): other = getattr(other, i)
+        except AttributeError:
+            differences.append(f'{qualname}: not defined in {path}')
+            continue
+        for label, value, other_value in _describe(target, other):
+            if value != other_value:
+                differences.append(
+                    f'{qualname}: {label} differ (live {value}, frozen '
+                    f'{other_value})')
+    return differences
+
+
+def _describe(target: type, other: type):
+    """internal function to generate labels and comparable descriptions of
+    disinheritance in live and frozen types
+    """
+    def blocked(i: type) -> set[str]:
+        return set(k for k, v in vars(i).items()
+                   if disinherit._is_blocked(v))
+    def exempt(i: type) -> dict[str, str]:
+        plan = disinherit._applied[target]
+        return dict((k, _describe_value(vars(i).get(k)))
+                    for k, _ in plan.exempt if k in vars(i))
+    def guards(i: type) -> set[str]:
+        return set(k for k in ('__dir__', '__getattribute__')
+                   if k in vars(i))
+    def special(i: type) -> set[str]:
+        names = set(k for j in i.__mro__ for k in vars(j)
+                    if k.startswith('__') and k.endswith('__'))
+        names.add('__hash__')
+        return set(f'{k}: {_describe_value(_get_special(i, k))}'
+                   for k in names)
+    for label, function in (('disinherited names', blocked),
+                            ('exemptions', exempt), ('dir() names', dir),
+                            ('guards', guards), ('special methods', special)):
+        value, other_value = function(target), function(other)
+        if isinstance(value, (set, list)):
+            value, other_value = set(value), set(other_value)
+            value, other_value = (sorted(value - other_value),
+                                  sorted(other_value - value))
+        yield label, value, other_value
+    return
+
+
+def _describe_value(value: object) -> str:
+    """internal function to describe a method/attribute comparably between
+    live and frozen modules (properties by their getters)
+    """
+    name = getattr(value, '__qualname__', None)
+    if name is None and isinstance(value, property):
+        name = getattr(value.fget, '__qualname__', None)
+        if name is not None: name = f'property {name}'
+    return repr(value) if name is None else name
+
+
+def _find_targets(module) -> dict[str, type]:
+    """internal function to map qualified names to disinherited types
+    defined in a module (resolving deferred disinheritance)
+    """
+    disinherit._resolve_pending(tuple(
+        i for i in list(disinherit._pending)
+        if i.__module__ == module.__name__))
+    return dict((i.__qualname__, i) for i in list(disinherit._applied)
+                if i.__module__ == module.__name__
+                and '<locals>' not in i.__qualname__)
+
+
+def _get_special(target: type, name: str) -> object:
+    """internal function to retrieve a special method/attribute as owned
+    by the first type in the target type MRO owning it (or None)
+    """
+    try: return disinherit._get_static(target, name)
+    except AttributeError: return None
+
+
+class _Freezer(ast.NodeTransformer):
+
+    """internal AST transformer to replace disinherit decorators in type
+    definitions with explicit overrides
+    """
+
+    def __init__(self, targets: dict[str, type]):
+        self.targets = targets
+        self.scope = list()
+        self.typed = False
+        return
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> ast.FunctionDef:
+        return node
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> ast.AST | list:
+        self.scope.append(node.name)
+        self.generic_visit(node)
+        target = self.targets.get('.'.join(self.scope))
+        self.scope.pop()
+        if target is None: return node
+        decorators = list(i for i in node.decorator_list
+                          if 'disinherit' not in ast.unparse(i))
+        if len(decorators) == len(node.decorator_list) and \
+           any(i in disinherit._propagating for i in target.__mro__[1:]):
+            return node
+        node.decorator_list = decorators
+        plan, namespace = disinherit._applied[target], vars(target)
+        blocked = sorted(i for i in plan.blocked
+                         if disinherit._is_blocked(namespace.get(i)))
+        body = list(i for i in node.body if not isinstance(i, ast.Pass))
+        assigned = set(j.id for i in body if isinstance(i, ast.Assign)
+                       for j in i.targets if isinstance(j, ast.Name))
+        if '__slots__' in namespace and '__slots__' not in assigned:
+            slots = namespace['__slots__']
+            body.append(ast.parse(f'__slots__ = {repr(slots)}').body[0])
+        if type(target) is DisinheritedType and \
+           not any(i.arg == 'metaclass' for i in node.keywords):
+            node.keywords.append(ast.keyword(
+                'metaclass', ast.Name('_DisinheritedType', ast.Load())))
+            self.typed = True
+        for i in blocked:
+            if i in _OPERATORS: continue
+            if i.isidentifier() and not iskeyword(i) and not \
+               (i.startswith('__') and not i.endswith('__')):
+                body.append(ast.parse(f'{i} = NotImplemented').body[0])
+        node.body = body or node.body
+        exempt = list()
+        for i, value in plan.exempt:
+            if i not in namespace or namespace[i] != value: continue
+            for index, source in enumerate(target.__mro__[1:], 1):
+                try: found = disinherit._get_static(source, i) is value
+                except AttributeError: found = False
+                if found:
+                    exempt.append((i, index))
+                    break
+        mro = tuple(map(disinherit._make_type_key, target.__mro__[1:]))
+        options = ', propagate=True' \
+                  if target in disinherit._propagating else ''
+        markers = list(namespace.get(i) for i in blocked)
+        if any(type(i) is _Blocked and i.type_level for i in markers):
+            options += ', type_level=True'
+        elif any(type(i) is _Blocked for i in markers):
+            options += ', descriptor=True'
+        call = ast.parse(
+            f'_disinherit.in_type_frozen({node.name}, mro={repr(mro)}, '
+            f'blocked={repr(tuple(blocked))}, '
+            f'exempt={repr(tuple(exempt))}{options})').body[0]
+        return [node, call]
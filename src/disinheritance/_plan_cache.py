@@ -0,0 +1,128 @@
+"""module for persistent (on-disk) caching of compiled disinheritance
+plans
+"""
+
+
+import json
+import os
+import sys
+import time
+from tempfile import mkstemp
+
+
+__all__ = 'PlanCache',
+
+
+class PlanCache:
+
+    """on-disk cache of compiled disinheritance plans (see
+    disinherit.compile), with entries keyed by fingerprints of base MROs
+    and exemptions
+
+    - entries are written atomically (to a temporary file replacing the
+      entry), so concurrent processes may read and write the same entries
+    - entries from other Python versions are never loaded and are removed
+      when pruned
+    - errors reading or writing entries are ignored (i.e., treated as
+      cache misses)
+    """
+
+    python = f'{sys.implementation.cache_tag}:{sys.version}'
+    suffix = '.json'
+
+    def __init__(self, path: str = None):
+        self.path = self.default_path() if path is None else os.fspath(path)
+        return
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({repr(self.path)})'
+
+    @classmethod
+    def default_path(cls) -> str:
+        """returns the default cache directory, from the
+        DISINHERITANCE_CACHE_DIR environment variable (or a disinheritance
+        directory in the user cache directory)
+        """
+        path = os.environ.get('DISINHERITANCE_CACHE_DIR')
+        if path: return path
+        base = os.environ.get('XDG_CACHE_HOME') or \
+               os.path.join(os.path.expanduser('~'), '.cache')
+        return os.path.join(base, 'disinheritance')
+
+    def clear(self) -> int:
+        """removes all entries (and temporary files) from the cache,
+        returning the number of files removed
+        """
+        return self._remove(lambda path, entry: True)
+
+    def load(self, fingerprint: str) -> dict | None:
+        """returns the entry for a fingerprint, or None if there is no
+        valid entry for the fingerprint in this Python version
+        """
+        try:
+            with open(self._make_path(fingerprint), 'rb') as file:
+                entry = json.loads(file.read())
+        except (OSError, ValueError): return None
+        if not isinstance(entry, dict) or entry.get('python') != self.python:
+            return None
+        return entry
+
+    def prune(self, max_age: float = None) -> int:
+        """removes entries from other Python versions, invalid entries,
+        temporary files abandoned for over an hour, and (optionally)
+        entries not written within a maximum age in seconds, returning the
+        number of files removed
+        """
+        now = time.time()
+        def expired(path: str, entry: dict | None) -> bool:
+            age = now - os.stat(path).st_mtime
+            if entry is None: return age > 3600
+            return entry.get('python') != self.python or \
+                   (max_age is not None and age > max_age)
+        return self._remove(expired)
+
+    def store(self, fingerprint: str, entry: dict) -> bool:
+        """writes the entry for a fingerprint atomically, returning whether
+        the entry was written
+        """
+        entry = dict(entry, python=self.python)
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            handle, temp = mkstemp(suffix='.tmp', prefix='.', dir=self.path)
+            try:
+                with os.fdopen(handle, 'w') as file: json.dump(entry, file)
+                os.replace(temp, self._make_path(fingerprint))
+            except BaseException:
+                os.unlink(temp)
+                raise
+        except OSError: return False
+        return True
+
+    def _make_path(self, fingerprint: str) -> str:
+        """internal method to return the entry path for a fingerprint"""
+        return os.path.join(self.path, fingerprint + self.suffix)
+
+    def _remove(self, predicate) -> int:
+        """internal method to remove entries and temporary files from the
+        cache where a predicate of the file path and entry (None for
+        temporary files, empty for invalid entries) is true
+        """
+        try: names = os.listdir(self.path)
+        except OSError: return 0
+        removed = 0
+        for name in names:
+            path = os.path.join(self.path, name)
+            entry = None
+            if name.endswith(self.suffix):
+                try:
+                    with open(path, 'rb') as file:
+                        entry = json.loads(file.read())
+                except (OSError, ValueError): pass
+                if not isinstance(entry, dict): entry = dict()
+            elif not name.endswith('.tmp'): continue
+            try:
+                if predicate(path, entry):
+                    os.unlink(path)
+                    removed += 1
+            except OSError: pass
+        return removed
@@ -0,0 +1,42 @@
+"""tests for cached names of types (see disinherit._map_cached,
+disinherit._map_names and disinherit._get_visible)
+"""
+
+
+import pytest
+
+from disinheritance import DisinheritedAttributeError
+from disinheritance import disinherit
+
+
+def test_renamed_ancestor_name_detected():
+    class Base:
+        def foo(self): return 'foo'
+    @disinherit()
+    class A(Base): pass
+    del Base.foo
+    Base.bar = lambda self: 'bar'
+    @disinherit()
+    class B(Base): pass
+    assert 'foo' not in vars(B)
+    with pytest.raises(DisinheritedAttributeError): B().bar
+
+
+def test_reassigned_blocked_name_listed_by_dir():
+    @disinherit()
+    class T(str): pass
+    assert 'upper' not in dir(T('a'))
+    T.upper = lambda self: 'U'
+    assert T('a').upper() == 'U'
+    assert 'upper' in dir(T('a'))
+
+
+def test_available_names_cached_for_target_types_only():
+    base = object
+    for i in range(20): base = type(f'L{i}', (base,), {f'm{i}': None})
+    @disinherit()
+    class T(base): pass
+    assert not any(i in disinherit._available for i in base.__mro__)
+    assert disinherit._map_names(T) >= {f'm{i}' for i in range(20)}
+    assert T in disinherit._available
+    with pytest.raises(DisinheritedAttributeError): T().m0
@@ -0,0 +1,85 @@
+"""tests for filtering of dir() calls (see disinherit._wrap_dir)"""
+
+
+import pytest
+
+from disinheritance import DisinheritedType
+from disinheritance import disinherit
+
+
+class Counting:
+
+    """non-data descriptor counting retrievals"""
+
+    def __init__(self):
+        self.count = 0
+
+    def __get__(self, instance, owner=None):
+        self.count += 1
+        return self
+
+
+class Record:
+
+    accessed = 0
+    lazy = Counting()
+
+    @property
+    def computed(self):
+        Record.accessed += 1
+        return
+
+
+def make_targets(**options):
+    @disinherit(**options)
+    class Default(Record):
+        @property
+        def own(self):
+            Record.accessed += 1
+            return
+    @disinherit(**options)
+    class Overridden(Record):
+        @property
+        def own(self):
+            Record.accessed += 1
+            return
+        def __dir__(self):
+            return [*super().__dir__(), 'extra']
+    return Default, Overridden
+
+
+@pytest.mark.parametrize('options', (
+    {}, {'descriptor': True}, {'type_level': True}))
+def test_dir_retrieves_no_properties(options):
+    Record.accessed, vars(Record)['lazy'].count = 0, 0
+    for target in make_targets(**options):
+        names = dir(target())
+        assert 'own' in names
+        assert 'computed' not in names and 'lazy' not in names
+    assert 'extra' in names
+    assert Record.accessed == 0 and vars(Record)['lazy'].count == 0
+
+
+def test_type_level_dir_needs_declared_metaclass():
+    @disinherit(type_level=True)
+    class Plain(str): pass
+    @disinherit(type_level=True)
+    class Declared(str, metaclass=DisinheritedType): pass
+    @disinherit(type_level='rebuild')
+    class Rebuilt(str):
+        def own(self): return super().upper()
+    assert type(Plain) is type and 'upper' in dir(Plain)
+    assert 'upper' not in dir(Declared)
+    assert type(Rebuilt) is DisinheritedType and 'upper' not in dir(Rebuilt)
+    assert Rebuilt.__qualname__.endswith('.Rebuilt')
+    assert Rebuilt('a').own() == 'A' and Rebuilt('a').__dict__ == {}
+    for target in (Plain, Declared, Rebuilt):
+        assert not hasattr(target, 'upper')
+        assert not hasattr(target('a'), 'upper')
+
+
+def test_type_level_rebuild_with_slots():
+    @disinherit(type_level='rebuild', slots=True)
+    class Rebuilt(str): pass
+    assert type(Rebuilt) is DisinheritedType and 'upper' not in dir(Rebuilt)
+    assert not hasattr(Rebuilt('a'), '__dict__')
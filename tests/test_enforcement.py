@@ -0,0 +1,50 @@
+"""tests for enforcement modes (see disinherit.set_enforcement)"""
+
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import disinheritance
+from disinheritance import disinherit
+
+
+@pytest.fixture
+def audit():
+    reports = list()
+    disinherit.set_enforcement('audit', report=lambda *i: reports.append(i))
+    yield reports
+    disinherit.set_enforcement('strict')
+
+
+def test_audit_leaves_special_methods_inherited(audit):
+    @disinherit()
+    class L(list): pass
+    x = L([1, 2])
+    assert len(x) == 2 and list(iter(x)) == [1, 2]
+    assert 2 in x and x[0] == 1 and x == [1, 2]
+    x.append(3)
+    assert x == [1, 2, 3]
+    assert [(i, name) for i, name, _ in audit] == [(L, 'append')]
+
+
+def test_audit_reports_once_per_call_site(audit):
+    @disinherit()
+    class S(str): pass
+    for _ in range(3): assert S('a').upper() == 'A'
+    assert len(audit) == 1
+
+
+@pytest.mark.parametrize('value, mode', (
+    ('AUDIT', 'audit'), (' Off ', 'off'), ('bogus', 'strict')))
+def test_environment_variable(value, mode):
+    path = os.path.dirname(os.path.dirname(disinheritance.__file__))
+    env = dict(os.environ, DISINHERITANCE_ENFORCEMENT=value, PYTHONPATH=path)
+    result = subprocess.run(
+        (sys.executable, '-c', 'from disinheritance import disinherit; '
+         'print(disinherit.get_enforcement())'),
+        env=env, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == mode
+    assert ('RuntimeWarning' in result.stderr) == (mode == 'strict')
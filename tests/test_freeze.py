@@ -0,0 +1,64 @@
+"""tests for ahead-of-time ("frozen") disinheritance"""
+
+
+import importlib.util
+import sys
+
+from disinheritance import DisinheritedType
+from disinheritance import freeze_module
+from disinheritance import verify_frozen
+
+
+SOURCE = '''from disinheritance import disinherit
+
+
+@disinherit(exempt=[str.upper])
+class Tok(str):
+    def own(self): return 1
+'''
+
+
+def _write_module(tmp_path, monkeypatch, name: str,
+                  source: str = SOURCE) -> str:
+    (tmp_path / f'{name}.py').write_text(source)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, name, raising=False)
+    return str(tmp_path / f'{name}_frozen.py')
+
+
+def _load(name: str, path: str):
+    spec = importlib.util.spec_from_file_location(f'{name}_frozen', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_frozen_type_stays_hashable(tmp_path, monkeypatch):
+    path = _write_module(tmp_path, monkeypatch, 'freeze_hash')
+    source = freeze_module('freeze_hash')
+    assert '__eq__ = NotImplemented' not in source
+    with open(path, 'w') as file: file.write(source)
+    frozen = _load('freeze_hash', path)
+    assert hash(frozen.Tok('a')) == hash('a')
+    assert verify_frozen('freeze_hash', path) == []
+
+
+def test_verify_reports_hash_drift(tmp_path, monkeypatch):
+    path = _write_module(tmp_path, monkeypatch, 'freeze_drift')
+    source = freeze_module('freeze_drift').replace(
+        '    def own(self):',
+        '    __eq__ = NotImplemented\n\n    def own(self):')
+    with open(path, 'w') as file: file.write(source)
+    differences = verify_frozen('freeze_drift', path)
+    assert any('__hash__' in i for i in differences)
+
+
+def test_frozen_type_keeps_rebuilt_metaclass(tmp_path, monkeypatch):
+    source = SOURCE.replace('@disinherit(exempt=[str.upper])',
+                            "@disinherit(type_level='rebuild')")
+    path = _write_module(tmp_path, monkeypatch, 'freeze_typed', source)
+    with open(path, 'w') as file: file.write(freeze_module('freeze_typed'))
+    frozen = _load('freeze_typed', path)
+    assert type(frozen.Tok) is DisinheritedType
+    assert 'upper' not in dir(frozen.Tok)
+    assert verify_frozen('freeze_typed', path) == []
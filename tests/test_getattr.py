@@ -0,0 +1,36 @@
+"""tests for wrapping of __getattr__ (see disinherit._wrap_getattr)"""
+
+
+import pytest
+
+from disinheritance import disinherit
+
+
+class Delegating:
+
+    def __init__(self):
+        self.data = {'known': 1}
+
+    def __getattr__(self, name):
+        try: return self.__dict__['data'][name]
+        except KeyError: raise AttributeError(name) from None
+
+    def method(self):
+        return
+
+
+@pytest.mark.parametrize('options', (
+    {}, {'descriptor': True}, {'type_level': True}))
+def test_inherited_getattr_retained(options):
+    @disinherit(**options)
+    class X(Delegating): pass
+    assert X.__getattr__ is not NotImplemented
+    assert not hasattr(X(), 'missing')
+    assert not hasattr(X(), 'method')
+    assert X().known == 1
+
+
+def test_disinherited_getattr_not_wrapped():
+    class X: __getattr__ = NotImplemented
+    disinherit._wrap_getattr(X, frozenset({'method'}))
+    assert vars(X)['__getattr__'] is NotImplemented
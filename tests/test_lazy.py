@@ -0,0 +1,59 @@
+"""tests for deferred disinheritance (see disinherit.in_type_lazy)"""
+
+
+import copy
+import pickle
+import sys
+
+import pytest
+
+from disinheritance import disinherit
+
+
+class Lazy(str): pass
+
+
+PAYLOAD = pickle.dumps(Lazy('a'))
+
+
+def make_lazy(**namespace):
+    target = type('Lazy', (str,), namespace)
+    exempt = str.upper, str.__getnewargs__
+    return disinherit(exempt=exempt, lazy=True)(target)
+
+
+def assert_resolved(target, obj):
+    assert not hasattr(obj, 'lower') and obj.upper() == 'A'
+    assert target not in disinherit._pending
+    assert disinherit._applied[target].mro == target.__mro__[1:]
+
+
+def test_resolved_on_instantiation():
+    target = make_lazy()
+    assert target in disinherit._pending
+    assert_resolved(target, target('a'))
+
+
+@pytest.mark.parametrize('create', (
+    lambda target: target.__new__(target, 'a'),
+    lambda target: copy.copy(target.__new__(target, 'a')),
+    lambda target: pickle.loads(PAYLOAD)))
+def test_resolved_without_init(monkeypatch, create):
+    target = make_lazy()
+    monkeypatch.setattr(sys.modules[__name__], 'Lazy', target)
+    obj = create(target)
+    assert type(obj) is target
+    assert_resolved(target, obj)
+
+
+def test_owned_methods_restored():
+    def __init__(self, *args): self.initialized = True
+    def __getattribute__(self, name):
+        return str.__getattribute__(self, name)
+    target = make_lazy(__init__=__init__, __getattribute__=__getattribute__)
+    obj = target.__new__(target, 'a')
+    assert_resolved(target, obj)
+    assert vars(target)['__init__'] is __init__
+    assert disinherit._wrappers[target.__getattribute__][0] is \
+           __getattribute__
+    assert target('a').initialized
@@ -0,0 +1,48 @@
+"""tests for counting of failed retrievals (see disinherit.enable_metrics)"""
+
+
+from threading import Thread
+
+import pytest
+
+from disinheritance import disinherit
+
+
+@pytest.fixture
+def metrics():
+    disinherit.enable_metrics()
+    yield
+    disinherit.disable_metrics()
+
+
+@pytest.mark.parametrize('descriptor', (False, True))
+def test_counted_once_with_getattr(metrics, descriptor):
+    @disinherit(descriptor=descriptor)
+    class X(dict):
+        def __getattr__(self, name):
+            raise AttributeError(name)
+    for _ in range(3): assert not hasattr(X(), 'keys')
+    assert disinherit.get_metrics()[X] == {'keys': 3}
+
+
+@pytest.mark.parametrize('descriptor', (False, True))
+def test_counted_once_without_getattr(metrics, descriptor):
+    @disinherit(descriptor=descriptor)
+    class X(dict): pass
+    for _ in range(3): assert not hasattr(X(), 'keys')
+    assert disinherit.get_metrics()[X] == {'keys': 3}
+
+
+def test_ended_thread_tables_folded(metrics):
+    @disinherit()
+    class X(dict): pass
+    def fail():
+        for _ in range(3): assert not hasattr(X(), 'keys')
+    for _ in range(2):
+        threads = list(Thread(target=fail) for _ in range(8))
+        for thread in threads: thread.start()
+        for thread in threads: thread.join()
+    assert disinherit._tables == []
+    fail()
+    assert len(disinherit._tables) == 1
+    assert disinherit.get_metrics()[X] == {'keys': 51}
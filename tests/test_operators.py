@@ -0,0 +1,65 @@
+"""tests for disinherited operator and protocol methods (see _Unsupported)"""
+
+
+import subprocess
+import sys
+
+import pytest
+
+from disinheritance import disinherit
+
+
+@disinherit()
+class Meters(float): pass
+
+
+@disinherit()
+class StrStandin(str):
+    def __repr__(self):
+        return 'StrStandin()'
+
+
+@disinherit()
+class ListStandin(list): pass
+
+
+def test_reflected_fallback():
+    assert Meters(3) + 1.5 == 4.5
+    assert 1.5 + Meters(3) == 4.5
+    assert Meters(3) == 3.0
+
+
+def test_unsupported_on_both_sides():
+    with pytest.raises(TypeError, match='unsupported operand'):
+        Meters(3) + 'a'
+    with pytest.raises(TypeError):
+        'a' + Meters(3)
+    with pytest.raises(TypeError):
+        Meters(3) < 'a'
+
+
+@pytest.mark.parametrize('call, message', (
+    (lambda: iter(StrStandin('x')), 'not iterable'),
+    (lambda: 'x' in StrStandin('x'), 'not a container'),
+    (lambda: reversed(ListStandin()), 'not reversible'),
+    (lambda: len(StrStandin('x')), "disinherited '__len__'"),
+    (lambda: StrStandin('x')[0], "disinherited '__getitem__'")))
+def test_unsupported_protocols(call, message):
+    with pytest.raises(TypeError, match=message):
+        call()
+
+
+@pytest.mark.parametrize('name', ('__add__', '__iter__', '__len__'))
+def test_markers_not_retrieved(name):
+    with pytest.raises(AttributeError):
+        getattr(StrStandin('x'), name)
+    assert name not in dir(StrStandin('x'))
+
+
+def test_no_warnings():
+    code = 'from disinheritance import disinherit\n'\
+           '@disinherit()\n'\
+           'class Meters(float): pass\n'\
+           'assert Meters(3) + 1.5 == 4.5\n'
+    subprocess.run((sys.executable, '-W', 'error', '-c', code),
+                   check=True, env={'PYTHONPATH': 'src'})
@@ -0,0 +1,58 @@
+"""tests for compiled plans (see disinherit.compile and
+DisinheritancePlan)
+"""
+
+
+import pytest
+
+from disinheritance import DisinheritancePlan
+from disinheritance import DisinheritedAttributeError
+from disinheritance import disinherit
+
+
+def test_plans_shared():
+    plan = disinherit.compile(str, [str.upper])
+    assert disinherit.compile(str, (str.upper,)) is plan
+    assert disinherit.compile(str.__mro__, [str.upper]) is plan
+    assert disinherit.compile(str) is not plan
+
+
+def test_recompiled_when_ancestor_names_change():
+    class Base:
+        def method(self): return
+    plan = disinherit.compile(Base)
+    assert disinherit.compile(Base) is plan
+    Base.added = 1
+    recompiled = disinherit.compile(Base)
+    assert recompiled is not plan
+    assert 'added' not in plan.blocked and 'added' in recompiled.blocked
+
+
+def test_plans_immutable():
+    plan = disinherit.compile(str)
+    for name in ('blocked', 'mro', 'other'):
+        with pytest.raises(AttributeError, match='immutable'):
+            setattr(plan, name, None)
+        with pytest.raises(AttributeError, match='immutable'):
+            delattr(plan, name)
+    assert isinstance(plan.blocked, frozenset)
+
+
+def test_apply_to_targets_with_base_mro():
+    plan = disinherit.compile(str, str.upper)
+    assert isinstance(plan, DisinheritancePlan)
+    first, second = (plan.apply(type(i, (str,), {})) for i in 'AB')
+    for target in (first, second):
+        assert disinherit._applied[target] is plan
+        assert target('a').upper() == 'A'
+        with pytest.raises(DisinheritedAttributeError): target('a').lower
+
+
+def test_apply_rejects_mismatched_mro():
+    plan = disinherit.compile(str)
+    class Other(bytes): pass
+    class Deeper(type('Middle', (str,), {})): pass
+    for target in (Other, Deeper):
+        with pytest.raises(TypeError, match='base MRO'):
+            plan.apply(target)
+        assert target not in disinherit._applied
@@ -0,0 +1,91 @@
+"""tests for the on-disk cache of compiled plans (see PlanCache and
+disinherit.enable_plan_cache)
+"""
+
+
+import json
+import multiprocessing
+import os
+from weakref import WeakValueDictionary
+
+import pytest
+
+from disinheritance import disinherit
+from disinheritance._plan_cache import PlanCache
+
+
+@pytest.fixture
+def plan_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(disinherit, '_plans', WeakValueDictionary())
+    yield disinherit.enable_plan_cache(tmp_path)
+    disinherit.disable_plan_cache()
+
+
+def make_base():
+    class Base:
+        def method(self): return
+    class Middle(Base):
+        def other(self): return
+    return Middle
+
+
+def entries(plan_cache):
+    return sorted(i for i in os.listdir(plan_cache.path)
+                  if not i.startswith('.'))
+
+
+def test_round_trip(plan_cache, monkeypatch):
+    base = make_base()
+    exempt = base.__mro__[1]
+    stored = disinherit.compile(base, exempt)
+    assert len(entries(plan_cache)) == 1
+    def coerce(*args): raise AssertionError('plan not loaded')
+    monkeypatch.setattr(disinherit, '_plans', WeakValueDictionary())
+    monkeypatch.setattr(disinherit, '_coerce_exempt', coerce)
+    loaded = disinherit.compile(base, exempt)
+    assert loaded is not stored
+    assert loaded.blocked == stored.blocked and 'other' in loaded.blocked
+    assert loaded.exempt == stored.exempt
+    assert dict(loaded.exempt)['method'] is vars(exempt)['method']
+
+
+def test_invalidated_by_ancestor_names(plan_cache, monkeypatch):
+    base = make_base()
+    before = disinherit.compile(base)
+    monkeypatch.setattr(disinherit, '_plans', WeakValueDictionary())
+    base.__mro__[1].added = 1
+    after = disinherit.compile(base)
+    assert 'added' not in before.blocked and 'added' in after.blocked
+    assert len(entries(plan_cache)) == 2
+
+
+def test_prune_and_clear(plan_cache):
+    for i in range(3): plan_cache.store(f'entry{i}', {'blocked': []})
+    with open(os.path.join(plan_cache.path, 'other.json'), 'w') as file:
+        json.dump({'python': 'other', 'blocked': []}, file)
+    abandoned = os.path.join(plan_cache.path, '.abandoned.tmp')
+    open(abandoned, 'w').close()
+    os.utime(abandoned, (0, 0))
+    assert plan_cache.prune() == 2
+    assert entries(plan_cache) == ['entry0.json', 'entry1.json',
+                                   'entry2.json']
+    os.utime(os.path.join(plan_cache.path, 'entry0.json'), (0, 0))
+    assert plan_cache.prune(max_age=3600) == 1
+    assert plan_cache.load('entry0') is None
+    assert plan_cache.clear() == 2 and entries(plan_cache) == []
+
+
+def write(path):
+    plan_cache = PlanCache(path)
+    loaded = 0
+    for i in range(200):
+        assert plan_cache.store('shared', {'blocked': [str(i)] * 100})
+        entry = plan_cache.load('shared')
+        loaded += entry is not None and len(entry['blocked']) == 100
+    return loaded
+
+
+def test_concurrent_writers(tmp_path):
+    with multiprocessing.get_context('spawn').Pool(4) as pool:
+        assert pool.map(write, [tmp_path] * 4) == [200] * 4
+    assert os.listdir(tmp_path) == ['shared.json']
@@ -0,0 +1,63 @@
+"""tests for types rebuilt by decorators (see disinherit.in_rebuilt)"""
+
+
+from dataclasses import dataclass
+
+import pytest
+
+from disinheritance import DisinheritedAttributeError
+from disinheritance import disinherit
+
+
+class Base:
+    __slots__ = ()
+    def a(self): return 'a'
+    def b(self): return 'b'
+
+
+class Exempt:
+    __slots__ = ()
+    def a(self): return 'a'
+
+
+def test_rebuilt_before_disinherit_keeps_super():
+    @disinherit(exempt=Exempt)
+    @dataclass(slots=True)
+    class A(Exempt, Base):
+        x: int
+        def sup(self): return super().a()
+    assert A(1).sup() == 'a' and A(1) == A(1)
+    with pytest.raises(DisinheritedAttributeError): A(1).b
+
+
+def test_rebuilt_after_disinherit():
+    @disinherit.in_rebuilt
+    @dataclass(slots=True)
+    @disinherit(exempt=Exempt)
+    class B(Exempt, Base):
+        x: int
+        def sup(self): return super().a()
+    assert B in disinherit._applied and B(1).sup() == 'a'
+    with pytest.raises(DisinheritedAttributeError): B(1).b
+
+
+def test_rebuilt_detected_when_propagated():
+    @dataclass(slots=True)
+    @disinherit(exempt=Exempt, propagate=True)
+    class C(Exempt, Base):
+        x: int
+    class D(C): pass
+    assert C in disinherit._applied and D in disinherit._applied
+    with pytest.raises(DisinheritedAttributeError): D(1).b
+
+
+def test_other_closures_not_rebound():
+    def make(prev=None):
+        @disinherit()
+        class Node(str):
+            __slots__ = ()
+            def parent(self): return prev
+        return Node
+    first = make()
+    second = make(first)
+    assert second('x').parent() is first
@@ -0,0 +1,74 @@
+"""tests for propagation of disinheritance to subclasses (see
+disinherit.in_subclass), compared with direct disinheritance
+"""
+
+
+import pytest
+
+from disinheritance import disinherit
+
+
+class Mixin:
+
+    extra = 1
+
+    def upper(self):
+        return 'mixin'
+
+    def own(self):
+        return 'mixin'
+
+
+def make_base(**options):
+    @disinherit(exempt=str.upper, propagate=True, **options)
+    class Base(str):
+        def own(self):
+            return 'base'
+    return Base
+
+
+def make_owning(*bases):
+    class Owning(*bases):
+        def __getattribute__(self, name):
+            return super().__getattribute__(name)
+        def __init_subclass__(cls, **kwargs):
+            super().__init_subclass__(**kwargs)
+        def added(self):
+            return
+    return Owning
+
+
+def assert_equivalent(propagated, eager):
+    names = set(dir(str)) | set(vars(Mixin)) | {'own', 'added'}
+    for name in sorted(names):
+        assert hasattr(propagated('a'), name) == \
+               hasattr(eager('a'), name), name
+    assert set(dir(propagated('a'))) == set(dir(eager('a')))
+
+
+@pytest.mark.parametrize('options', ({}, {'descriptor': True}))
+@pytest.mark.parametrize('make', (
+    lambda base: type('Sub', (base,), {}),
+    lambda base: type('Sub', (Mixin, base), {}),
+    lambda base: type('Sub', (base, Mixin), {}),
+    lambda base: make_owning(base),
+    lambda base: make_owning(Mixin, base)))
+def test_propagated_matches_eager(options, make):
+    base = make_base(**options)
+    propagated = make(base)
+    eager = disinherit(exempt=[base, str.upper], **options)(make(base))
+    assert disinherit._applied[propagated].mro == \
+           disinherit._applied[eager].mro
+    assert_equivalent(propagated, eager)
+    assert propagated('a').upper() == 'A' and propagated('a').own() == 'base'
+    assert not hasattr(propagated('a'), 'lower')
+
+
+@pytest.mark.parametrize('options', ({}, {'descriptor': True}))
+def test_mixin_names_blocked(options):
+    base = make_base(**options)
+    class Sub(Mixin, base): pass
+    class Leaf(Sub): pass
+    for target in (Sub, Leaf):
+        assert not hasattr(target('a'), 'extra')
+        assert 'extra' not in dir(target('a'))